@@ -0,0 +1,97 @@
+import csv
+import json
+import os
+import re
+import zlib
+
+
+ORG_URL_RE = re.compile(r'/maps/org/([^/?#]+)/(\d+)')
+
+
+def org_id(url: str) -> str:
+    """id организации из ссылки Яндекс Карт (None если ссылка не на организацию)"""
+    match = ORG_URL_RE.search(url or '')
+    return match.group(2) if match else None
+
+
+def canonicalize_url(url: str) -> str:
+    """Приводит ссылку к виду https://yandex.ru/maps/org/<slug>/<id>/reviews/"""
+    match = ORG_URL_RE.search(url or '')
+    if not match:
+        return url
+    slug, oid = match.groups()
+    return f"https://yandex.ru/maps/org/{slug}/{oid}/reviews/"
+
+
+def _read_rows(path: str) -> list:
+    if path.endswith('.jsonl'):
+        rows = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    rows.append(json.loads(line))
+        return rows
+
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def load_catalog(path: str) -> list:
+    """Загружает список ресторанов из CSV (name,url) или JSONL.
+
+    Ссылки приводятся к каноническому виду, повторы одной организации отбрасываются.
+    """
+    restaurants = []
+    seen = set()
+
+    for row in _read_rows(path):
+        name = (row.get('name') or '').strip()
+        url = (row.get('url') or '').strip()
+        if not url:
+            continue
+
+        key = org_id(url) or url
+        if key in seen:
+            continue
+        seen.add(key)
+
+        restaurants.append({
+            'name': name,
+            'url': canonicalize_url(url)
+        })
+
+    return restaurants
+
+
+def parse_shard(value: str) -> tuple:
+    """'i/N' -> (i, N), где i от 0 до N-1"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Шард должен быть в формате i/N, получено: {value}")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Номер шарда должен быть от 0 до {count - 1}, получено: {value}")
+    return index, count
+
+
+def shard_restaurants(restaurants: list, index: int, count: int) -> list:
+    """Детерминированно оставляет рестораны шарда index из count (по хешу id организации)"""
+    if count <= 1:
+        return list(restaurants)
+    return [
+        restaurant for restaurant in restaurants
+        if zlib.crc32((org_id(restaurant['url']) or restaurant['url']).encode('utf-8')) % count == index
+    ]
+
+
+if __name__ == "__main__":
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "restaurants.csv"
+    shards = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    restaurants = load_catalog(path)
+    print(f"📋 {os.path.basename(path)}: {len(restaurants)} ресторанов")
+    for i in range(shards):
+        print(f"   Шард {i}/{shards}: {len(shard_restaurants(restaurants, i, shards))}")
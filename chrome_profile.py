@@ -0,0 +1,86 @@
+import json
+
+
+# Все, что не нужно для DOM отзывов: тайлы карты, картинки, шрифты, аналитика
+BLOCKED_URL_PATTERNS = [
+    '*core-renderer-tiles.maps.yandex.net*',
+    '*core-jams-rdr-cache.maps.yandex.net*',
+    '*core-sat.maps.yandex.net*',
+    '*tiles.api-maps.yandex.ru*',
+    '*/tiles?*',
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif', '*.avif',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*mc.yandex.ru*',
+    '*an.yandex.ru*',
+    '*yandex.ru/clck*',
+    '*yandex.ru/ads*',
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+]
+
+
+def apply_lean_options(opts) -> None:
+    """Настройки Chrome: без картинок, eager-загрузка и лог сети для подсчета трафика"""
+    opts.page_load_strategy = 'eager'
+    opts.add_argument('--blink-settings=imagesEnabled=false')
+    opts.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    opts.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def enable_request_blocking(driver, patterns: list = None) -> None:
+    """Блокирует запросы по шаблонам через Chrome DevTools Protocol"""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns or BLOCKED_URL_PATTERNS})
+
+
+def reset_page_metrics(driver) -> None:
+    """Сбрасывает накопленный лог сети перед новой страницей"""
+    try:
+        driver.get_log('performance')
+    except Exception:
+        pass
+
+
+def collect_page_metrics(driver) -> dict:
+    """Трафик и время загрузки текущей страницы.
+
+    Байты считаются по событиям Network.loadingFinished из лога производительности,
+    время - по Navigation Timing.
+    """
+    metrics = {
+        'bytes_transferred': 0,
+        'requests': 0,
+        'blocked_requests': 0,
+        'dom_content_loaded_ms': None,
+        'load_ms': None
+    }
+
+    try:
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method = message.get('method')
+            if method == 'Network.loadingFinished':
+                metrics['bytes_transferred'] += int(message['params'].get('encodedDataLength', 0))
+                metrics['requests'] += 1
+            elif method == 'Network.loadingFailed' and message['params'].get('blockedReason'):
+                metrics['blocked_requests'] += 1
+    except Exception:
+        pass
+
+    try:
+        timing = driver.execute_script("""
+            var nav = performance.getEntriesByType('navigation')[0];
+            if (!nav) { return null; }
+            return [nav.domContentLoadedEventEnd - nav.startTime, nav.loadEventEnd - nav.startTime];
+        """)
+        if timing:
+            metrics['dom_content_loaded_ms'] = round(timing[0])
+            # При eager-загрузке событие load может еще не наступить
+            metrics['load_ms'] = round(timing[1]) if timing[1] > 0 else None
+    except Exception:
+        pass
+
+    return metrics
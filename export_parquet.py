@@ -0,0 +1,170 @@
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from json_stream import read_summary
+from output_format import iter_reviews
+
+
+# Плоская таблица отзывов: одна строка = один отзыв
+SCHEMA = pa.schema([
+    ('restaurant', pa.string()),
+    ('url', pa.string()),
+    ('parsed_at', pa.timestamp('s')),
+    ('author', pa.string()),
+    ('date', pa.string()),
+    ('stars', pa.float32()),
+    ('text', pa.string()),
+    ('sentiment', pa.dictionary(pa.int8(), pa.string())),
+    ('score', pa.int32()),
+    ('positive_words', pa.list_(pa.string())),
+    ('negative_words', pa.list_(pa.string())),
+    ('source_file', pa.string()),
+])
+
+MANIFEST_NAME = '_manifest.json'
+
+
+def _parse_time(value: str):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+
+
+def file_to_table(path: str) -> tuple:
+    """Превращает один файл результата в таблицу Arrow, возвращает (таблица, дата парсинга)"""
+    data = read_summary(path)
+
+    restaurant_info = data.get('restaurant_info', {})
+    parsed_at = _parse_time(restaurant_info.get('parsed_at'))
+    source_file = os.path.basename(path)
+
+    columns = {name: [] for name in SCHEMA.names}
+    for _, comment in iter_reviews(path, data):
+        analysis = comment.get('analysis', {})
+        columns['restaurant'].append(restaurant_info.get('name', 'Unknown'))
+        columns['url'].append(restaurant_info.get('url', ''))
+        columns['parsed_at'].append(parsed_at)
+        columns['author'].append(comment.get('name', ''))
+        columns['date'].append(comment.get('date', ''))
+        columns['stars'].append(float(comment.get('stars') or 0))
+        columns['text'].append(comment.get('text', ''))
+        columns['sentiment'].append(comment.get('sentiment', 'neutral'))
+        columns['score'].append(int(analysis.get('score', 0)))
+        columns['positive_words'].append(analysis.get('positive_words', []))
+        columns['negative_words'].append(analysis.get('negative_words', []))
+        columns['source_file'].append(source_file)
+
+    table = pa.Table.from_pydict(columns, schema=SCHEMA)
+    parse_date = parsed_at.strftime("%Y-%m-%d") if parsed_at else 'unknown'
+    return table, parse_date
+
+
+def load_manifest(dataset_dir: str) -> dict:
+    path = os.path.join(dataset_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(dataset_dir: str, manifest: dict) -> None:
+    path = os.path.join(dataset_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def export(output_dir: str, dataset_dir: str, file_format: str = 'parquet') -> dict:
+    """Дописывает в набор данных новые и измененные файлы из output_dir.
+
+    Каждый исходный файл пишется в parse_date=<дата>/<имя файла>.parquet, поэтому
+    повторный экспорт измененного файла перезаписывает его строки, а не дублирует их.
+    """
+    os.makedirs(dataset_dir, exist_ok=True)
+    manifest = load_manifest(dataset_dir)
+    extension = '.parquet' if file_format == 'parquet' else '.arrow'
+
+    stats = {'files': 0, 'skipped': 0, 'rows': 0, 'errors': 0}
+    json_files = sorted(f for f in os.listdir(output_dir) if f.endswith('.json'))
+
+    for json_file in json_files:
+        path = os.path.join(output_dir, json_file)
+        file_stat = os.stat(path)
+        signature = {'mtime': file_stat.st_mtime, 'size': file_stat.st_size}
+
+        previous = manifest.get(json_file)
+        if previous and previous['mtime'] == signature['mtime'] and previous['size'] == signature['size']:
+            stats['skipped'] += 1
+            continue
+
+        try:
+            table, parse_date = file_to_table(path)
+        except Exception as e:
+            print(f"❌ Ошибка с файлом {json_file}: {str(e)[:50]}")
+            stats['errors'] += 1
+            continue
+
+        partition_dir = os.path.join(dataset_dir, f"parse_date={parse_date}")
+        os.makedirs(partition_dir, exist_ok=True)
+        target = os.path.join(partition_dir, json_file[:-len('.json')] + extension)
+
+        if previous and previous.get('path') and previous['path'] != os.path.relpath(target, dataset_dir):
+            # Дата парсинга изменилась - убираем старую копию
+            old_target = os.path.join(dataset_dir, previous['path'])
+            if os.path.exists(old_target):
+                os.remove(old_target)
+
+        tmp_target = target + '.tmp'
+        if file_format == 'parquet':
+            pq.write_table(table, tmp_target, compression='zstd')
+        else:
+            feather.write_feather(table, tmp_target, compression='zstd')
+        os.replace(tmp_target, target)
+
+        manifest[json_file] = {**signature, 'rows': table.num_rows, 'path': os.path.relpath(target, dataset_dir)}
+        stats['files'] += 1
+        stats['rows'] += table.num_rows
+
+    save_manifest(dataset_dir, manifest)
+    return stats
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Экспорт всех отзывов из output/ в колоночный формат")
+    arg_parser.add_argument('--output-dir', default='output', help="Папка с reviews_*.json")
+    arg_parser.add_argument('--dataset-dir', default=os.path.join('export', 'reviews'),
+                            help="Куда писать набор данных (партиции parse_date=YYYY-MM-DD)")
+    arg_parser.add_argument('--format', choices=['parquet', 'arrow'], default='parquet',
+                            help="Parquet или Arrow IPC (Feather v2)")
+    args = arg_parser.parse_args()
+
+    print("=" * 60)
+    print("📦 ЭКСПОРТ ОТЗЫВОВ В КОЛОНОЧНЫЙ ФОРМАТ")
+    print("=" * 60)
+
+    if not os.path.exists(args.output_dir):
+        print(f"⚠️ Папка {args.output_dir} не найдена")
+        return
+
+    started = time.time()
+    stats = export(args.output_dir, args.dataset_dir, args.format)
+    elapsed = time.time() - started
+
+    print(f"✅ Экспортировано файлов: {stats['files']}, строк: {stats['rows']}")
+    print(f"⏭️  Без изменений: {stats['skipped']}, ошибок: {stats['errors']}")
+    print(f"⏱️  {elapsed:.1f} с")
+    print(f"📁 Набор данных: {args.dataset_dir}")
+    print(f"   Пример: duckdb -c \"SELECT sentiment, count(*) FROM '{args.dataset_dir}/*/*.{args.format}' GROUP BY 1\"")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,245 @@
-from pyhive import hive
+import argparse
+import hashlib
+import itertools
 import json
 import os
+import re
 import time
 
+from hive_pool import get_pool
+from json_stream import read_summary
+from output_loader import list_json_files, load_records, print_load_stats, record_values
+from output_format import iter_reviews
+
+# Сколько строк отправлять одним INSERT: каждый INSERT в Hive - отдельная задача,
+# поэтому строки копятся в пачки, а не вставляются по одной
+BATCH_SIZE = 500
+# Отзывы длинные, поэтому пачки для промежуточной таблицы отзывов меньше
+REVIEW_BATCH_SIZE = 200
+
+# Колонки review_facts (без партиции) в порядке review_rows()
+REVIEW_FACTS_COLUMNS = (
+    ('restaurant_name', 'STRING'),
+    ('source_url', 'STRING'),
+    ('review_id', 'STRING'),
+    ('author', 'STRING'),
+    ('review_date', 'STRING'),
+    ('stars', 'DOUBLE'),
+    ('review_text', 'STRING'),
+    ('sentiment', 'STRING'),
+    ('score', 'INT'),
+    ('positive_words', 'STRING'),
+    ('negative_words', 'STRING'),
+    ('parsed_date', 'STRING'),
+)
+# Папка, которую HiveServer2 видит по тому же пути (общий том). Если задана, отзывы
+# партиции пишутся в файл и попадают в промежуточную таблицу одним LOAD DATA
+STAGING_DIR = os.environ.get('HIVE_STAGING_DIR')
+
+# Локальный журнал загруженных файлов: имя файла + sha256 содержимого.
+# Расширение не .json, чтобы файл не принимали за результат парсера
+MANIFEST_PATH = os.path.join("output", ".hive_load_manifest.jsonl")
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def review_rows(path: str):
+    """Строки review_facts по одной на отзыв (генератор), найденные слова - через запятую.
+
+    Отзывы читаются из файла потоково, поэтому в памяти нет списка отзывов файла
+    """
+    restaurant_info = read_summary(path).get('restaurant_info', {})
+    for review_id, comment in iter_reviews(path):
+        analysis = comment.get('analysis', {})
+        yield (
+            restaurant_info.get('name', 'Unknown'),
+            restaurant_info.get('url', ''),
+            review_id,
+            comment.get('name', ''),
+            comment.get('date', ''),
+            float(comment.get('stars') or 0),
+            comment.get('text', ''),
+            comment.get('sentiment', 'neutral'),
+            int(analysis.get('score', 0)),
+            ','.join(analysis.get('positive_words', [])),
+            ','.join(analysis.get('negative_words', [])),
+            restaurant_info.get('parsed_at', '')
+        )
+
+
+def partition_review_rows(json_files: list, output_dir: str = "output"):
+    """Строки review_facts всех файлов одной даты подряд, файл за файлом"""
+    for json_file in json_files:
+        try:
+            yield from review_rows(os.path.join(output_dir, json_file))
+        except Exception as e:
+            print(f"❌ Ошибка чтения отзывов {json_file}: {str(e)[:50]}")
+
+
+def review_aggregates(cursor, parse_date: str = None) -> list:
+    """Агрегаты по отзывам на стороне Hive: одна строка на ресторан"""
+    where = f"WHERE parse_date = '{parse_date}'" if parse_date else ""
+    cursor.execute(f"""
+        SELECT restaurant_name,
+               COUNT(*) AS reviews,
+               AVG(stars) AS avg_stars,
+               AVG(score) AS avg_score,
+               SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END) AS positive,
+               SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END) AS negative
+        FROM review_facts
+        {where}
+        GROUP BY restaurant_name
+        ORDER BY reviews DESC
+    """)
+    columns = ['restaurant_name', 'reviews', 'avg_stars', 'avg_score', 'positive', 'negative']
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def parse_date_of(parsed_at: str) -> str:
+    """Дата парсинга YYYY-MM-DD - ключ партиции"""
+    parse_date = str(parsed_at or '')[:10]
+    return parse_date if DATE_RE.match(parse_date) else 'unknown'
+
+
+def file_hash(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> dict:
+    """{имя файла: {'sha256', 'parse_date'}} по последней записи для каждого файла"""
+    manifest = {}
+    if not os.path.exists(path):
+        return manifest
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            manifest[record['file']] = record
+    return manifest
+
+
+def append_manifest(records: list, path: str = MANIFEST_PATH) -> None:
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def insert_rows(cursor, table: str, rows, batch_size: int = BATCH_SIZE, partition: str = None) -> int:
+    """Вставляет строки многострочными INSERT ... VALUES (...), (...) по batch_size штук.
+
+    rows - любой итерируемый объект: в памяти держится только текущая пачка
+    """
+    target = f"{table} PARTITION (parse_date='{partition}')" if partition else table
+    rows = iter(rows)
+    inserted = 0
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        placeholders = "(" + ", ".join(["%s"] * len(batch[0])) + ")"
+        params = tuple(value for row in batch for value in row)
+        cursor.execute(
+            f"INSERT INTO {target} VALUES " + ", ".join([placeholders] * len(batch)),
+            params
+        )
+        inserted += len(batch)
+    return inserted
+
+
+def create_reviews_view(cursor) -> None:
+    """restaurant_reviews (ее читают визуализация и веб) - представление над партициями.
+
+    Так загрузка трогает только измененные даты, а не пересобирает плоскую копию.
+    Плоскую таблицу restaurant_reviews из прежних версий заменяем представлением.
+    """
+    cursor.execute("SHOW TABLES LIKE 'restaurant_reviews'")
+    if cursor.fetchall():
+        cursor.execute("DESCRIBE FORMATTED restaurant_reviews")
+        is_view = any('VIRTUAL_VIEW' in str(value) for row in cursor.fetchall() for value in row)
+        if not is_view:
+            cursor.execute("DROP TABLE restaurant_reviews")
+    cursor.execute("""
+        CREATE VIEW IF NOT EXISTS restaurant_reviews AS
+        SELECT restaurant_name, total_reviews, positive_reviews, negative_reviews, neutral_reviews,
+               positive_percentage, negative_percentage, parsed_date, source_url
+        FROM restaurant_reviews_by_date
+    """)
+
+
+def create_staging_table(cursor) -> None:
+    """Промежуточная текстовая таблица для отзывов одной партиции (JSON, по строке на отзыв)"""
+    columns = ", ".join(f"{name} {hive_type}" for name, hive_type in REVIEW_FACTS_COLUMNS)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS review_facts_staging ({columns})
+        ROW FORMAT SERDE 'org.apache.hadoop.hive.serde2.JsonSerDe'
+        STORED AS TEXTFILE
+    """)
+
+
+def stage_reviews(cursor, reviews, staging_dir: str = STAGING_DIR) -> int:
+    """Заменяет содержимое review_facts_staging строками reviews, возвращает их число.
+
+    reviews - итератор строк, он расходуется потоково. С общей папкой - один файл
+    и LOAD DATA, без нее - пачки INSERT в текстовую таблицу (мелкие файлы остаются
+    в промежуточной таблице, а не в ORC)
+    """
+    if not staging_dir:
+        cursor.execute("TRUNCATE TABLE review_facts_staging")
+        return insert_rows(cursor, "review_facts_staging", reviews, REVIEW_BATCH_SIZE)
+
+    path = os.path.join(staging_dir, "review_facts_staging.jsonl")
+    names = [name for name, _ in REVIEW_FACTS_COLUMNS]
+    staged = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in reviews:
+            f.write(json.dumps(dict(zip(names, row)), ensure_ascii=False) + '\n')
+            staged += 1
+    cursor.execute(f"LOAD DATA LOCAL INPATH '{path}' OVERWRITE INTO TABLE review_facts_staging")
+    return staged
+
+
+def reload_partition(cursor, parse_date: str, rows: list, reviews=None) -> int:
+    """Перезаливает одну дату: DROP PARTITION и вставка всех строк этой даты заново.
+
+    reviews - итератор строк review_facts той же даты (None - отзывы не трогаем). Они идут
+    через промежуточную таблицу и одним INSERT OVERWRITE ... SELECT, чтобы партиция
+    ORC была записана одной задачей - по файлу на бакет, без россыпи мелких файлов
+    """
+    cursor.execute(f"ALTER TABLE restaurant_reviews_by_date DROP IF EXISTS PARTITION (parse_date='{parse_date}')")
+    inserted = 0
+    if rows:
+        inserted += insert_rows(cursor, "restaurant_reviews_by_date", rows, partition=parse_date)
+
+    if reviews is not None:
+        staged = stage_reviews(cursor, reviews)
+        if staged:
+            columns = ", ".join(name for name, _ in REVIEW_FACTS_COLUMNS)
+            cursor.execute(f"""
+                INSERT OVERWRITE TABLE review_facts PARTITION (parse_date='{parse_date}')
+                SELECT {columns} FROM review_facts_staging
+            """)
+            inserted += staged
+        else:
+            cursor.execute(f"ALTER TABLE review_facts DROP IF EXISTS PARTITION (parse_date='{parse_date}')")
+    return inserted
+
+
 def main():
+    arg_parser = argparse.ArgumentParser(description="Загрузка результатов парсера в Hive")
+    arg_parser.add_argument('--full', action='store_true',
+                            help="Игнорировать журнал загрузки и перезалить все даты")
+    args = arg_parser.parse_args()
+
     print("="*60)
     print("📊 ПРОБУЕМ ПОДКЛЮЧИТЬСЯ К HIVE")
     print("="*60)
@@ -11,18 +247,17 @@ def main():
     try:
         # Пробуем подключиться
         print("🔌 Подключаемся к hive-server:10000...")
-        conn = hive.Connection(host='hive-server', port=10000)
+        # Соединение из общего пула: база создается и выбирается один раз при открытии
+        pool = get_pool(ensure_database=True)
+        conn = pool.acquire()
         cursor = conn.cursor()
         print("✅ Подключение успешно!")
-        
-        # Создаем базу данных
-        cursor.execute("CREATE DATABASE IF NOT EXISTS restaurant_analysis")
-        cursor.execute("USE restaurant_analysis")
         print("✅ База данных создана")
         
-        # Создаем таблицу
+        # Основная таблица с партициями по дате парсинга: повторная загрузка
+        # перезаписывает только затронутые даты
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS restaurant_reviews (
+            CREATE TABLE IF NOT EXISTS restaurant_reviews_by_date (
                 restaurant_name STRING,
                 total_reviews INT,
                 positive_reviews INT,
@@ -33,13 +268,36 @@ def main():
                 parsed_date STRING,
                 source_url STRING
             )
+            PARTITIONED BY (parse_date STRING)
+        """)
+        create_reviews_view(cursor)
+        
+        # Отзывы по одному: ORC с бакетами по ресторану, чтобы агрегаты и выборки
+        # по одному ресторану считались в Hive, а не перечитыванием JSON
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS review_facts (
+                restaurant_name STRING,
+                source_url STRING,
+                review_id STRING,
+                author STRING,
+                review_date STRING,
+                stars DOUBLE,
+                review_text STRING,
+                sentiment STRING,
+                score INT,
+                positive_words STRING,
+                negative_words STRING,
+                parsed_date STRING
+            )
+            PARTITIONED BY (parse_date STRING)
+            CLUSTERED BY (restaurant_name) INTO 8 BUCKETS
+            STORED AS ORC
         """)
-        print("✅ Таблица создана")
+        create_staging_table(cursor)
+        print("✅ Таблицы созданы")
         
         # Ищем JSON файлы
-        json_files = []
-        if os.path.exists("output"):
-            json_files = [f for f in os.listdir("output") if f.endswith('.json')]
+        json_files = list_json_files("output")
         
         if not json_files:
             print("⚠️ Нет JSON файлов в папке output/")
@@ -48,34 +306,68 @@ def main():
         
         print(f"📁 Найдено {len(json_files)} JSON файлов")
         
-        # Загружаем каждый файл
+        # Сравниваем с журналом: загружаем только новые и измененные файлы
+        manifest = {} if args.full else load_manifest()
+        hashes = {}
+        changed = []
         for json_file in json_files:
-            try:
-                with open(f"output/{json_file}", 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                restaurant_info = data.get('restaurant_info', {})
-                sentiment = data.get('sentiment_analysis', {})
-                
-                cursor.execute("""
-                    INSERT INTO restaurant_reviews VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    restaurant_info.get('name', 'Unknown'),
-                    sentiment.get('total_comments', 0),
-                    sentiment.get('positive_count', 0),
-                    sentiment.get('negative_count', 0),
-                    sentiment.get('neutral_count', 0),
-                    float(sentiment.get('positive_percentage', 0)),
-                    float(sentiment.get('negative_percentage', 0)),
-                    restaurant_info.get('parsed_at', ''),
-                    restaurant_info.get('url', '')
-                ))
-                
-                print(f"✅ Загружено: {restaurant_info.get('name', 'Unknown')}")
-                
-            except Exception as e:
-                print(f"❌ Ошибка с файлом {json_file}: {str(e)[:50]}")
-                continue
+            hashes[json_file] = file_hash(f"output/{json_file}")
+            previous = manifest.get(json_file)
+            if not previous or previous['sha256'] != hashes[json_file]:
+                changed.append(json_file)
+        
+        print(f"🆕 Новых или измененных: {len(changed)}, без изменений: {len(json_files) - len(changed)}")
+        if not changed:
+            print("✅ Загружать нечего")
+        
+        # Раскладываем файлы по датам парсинга. В памяти - только строки restaurant_reviews,
+        # отзывы потом читаются из файлов потоком прямо в промежуточную таблицу
+        summary_rows = {}
+        dates = {}
+        to_read = []
+        for json_file in json_files:
+            previous = manifest.get(json_file)
+            if json_file not in changed and previous and previous.get('parse_date'):
+                # Неизмененный файл нужен, только если его дата перезаливается
+                dates[json_file] = previous['parse_date']
+            else:
+                to_read.append(json_file)
+        
+        def read_rows(files: list) -> None:
+            loaded = load_records("output", files)
+            print_load_stats(loaded)
+            for json_file, record in loaded['records'].items():
+                dates[json_file] = parse_date_of(record['parsed_date'])
+                summary_rows[json_file] = record_values(record)
+        
+        read_rows(to_read)
+        
+        affected = {dates[f] for f in changed if f in dates}
+        # Если у измененного файла сменилась дата, старую партицию тоже пересобираем
+        affected |= {manifest[f]['parse_date'] for f in changed if f in manifest}
+        
+        start_time = time.time()
+        inserted = 0
+        for parse_date in sorted(affected):
+            files = sorted(f for f, file_date in dates.items() if file_date == parse_date)
+            missing = [f for f in files if f not in summary_rows]
+            if missing:
+                read_rows(missing)
+            files = [f for f in files if f in summary_rows]
+            
+            print(f"⏳ Партиция {parse_date}: {len(files)} ресторанов")
+            inserted += reload_partition(cursor, parse_date, [summary_rows[f] for f in files],
+                                         partition_review_rows(files))
+            append_manifest([
+                {'file': json_file, 'sha256': hashes[json_file], 'parse_date': parse_date,
+                 'loaded_at': time.time()}
+                for json_file in files
+            ])
+        
+        if affected:
+            elapsed = time.time() - start_time
+            print(f"✅ Вставлено {inserted} строк в {len(affected)} партиций за {elapsed:.1f} с "
+                  f"({inserted / max(elapsed, 0.001):.1f} строк/с)")
         
         # Проверяем что загрузилось
         cursor.execute("SELECT COUNT(*) FROM restaurant_reviews")
@@ -90,8 +382,14 @@ def main():
         for name, percent in results:
             print(f"  {name}: {percent}% позитивных")
         
+        print("\n⭐ Средние оценки по отзывам (review_facts):")
+        for row in review_aggregates(cursor)[:10]:
+            print(f"  {row['restaurant_name']}: {row['reviews']} отзывов, "
+                  f"★ {float(row['avg_stars'] or 0):.2f}, score {float(row['avg_score'] or 0):.2f}")
+        
         cursor.close()
-        conn.close()
+        pool.release(conn)
+        pool.close_all()
         
     except Exception as e:
         print(f"❌ Ошибка подключения к Hive: {e}")
@@ -0,0 +1,200 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from pyhive import hive
+
+
+class HivePool:
+    """Пул соединений с HiveServer2.
+
+    Соединение открывается с USE <database> один раз и дальше переиспользуется.
+    Не больше max_size соединений одновременно: остальные ждут освобождения
+    (не дольше acquire_timeout). Простаивающие дольше idle_timeout закрываются,
+    перед выдачей давно не проверенное соединение проверяется запросом SELECT 1.
+    """
+
+    def __init__(self, host: str = 'hive-server', port: int = 10000, database: str = 'restaurant_analysis',
+                 max_size: int = 4, idle_timeout: float = 300, acquire_timeout: float = 30,
+                 health_check_interval: float = 30, ensure_database: bool = False):
+        self.host = host
+        self.port = port
+        self.database = database
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self.ensure_database = ensure_database
+
+        self.condition = threading.Condition()
+        self.idle = []  # [{'conn', 'last_used', 'last_checked'}], последнее освобожденное - в конце
+        self.checked_out = {}  # id(conn) -> запись
+        self.opening = 0  # соединения, которые сейчас открываются
+        self.metrics = {
+            'acquired': 0,
+            'created': 0,
+            'closed': 0,
+            'health_failures': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'max_wait_seconds': 0.0
+        }
+
+    def _open(self) -> dict:
+        conn = hive.Connection(host=self.host, port=self.port)
+        try:
+            cursor = conn.cursor()
+            if self.ensure_database:
+                cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database}")
+            cursor.execute(f"USE {self.database}")
+            cursor.close()
+        except Exception:
+            conn.close()
+            raise
+        now = time.time()
+        return {'conn': conn, 'last_used': now, 'last_checked': now}
+
+    def _close(self, record: dict) -> None:
+        try:
+            record['conn'].close()
+        except Exception:
+            pass
+        with self.condition:
+            self.metrics['closed'] += 1
+
+    def _healthy(self, record: dict) -> bool:
+        if time.time() - record['last_checked'] < self.health_check_interval:
+            return True
+        try:
+            cursor = record['conn'].cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            record['last_checked'] = time.time()
+            return True
+        except Exception:
+            with self.condition:
+                self.metrics['health_failures'] += 1
+            return False
+
+    def _total(self) -> int:
+        return len(self.idle) + len(self.checked_out) + self.opening
+
+    def acquire(self):
+        """Берет соединение из пула (или открывает новое)"""
+        started = time.time()
+        waited = False
+
+        while True:
+            record = None
+            expired = []
+            with self.condition:
+                now = time.time()
+                # Закрываем простаивающие слишком долго
+                while self.idle and now - self.idle[0]['last_used'] > self.idle_timeout:
+                    expired.append(self.idle.pop(0))
+
+                if self.idle:
+                    record = self.idle.pop()
+                    # Пока идет проверка, соединение считается занятым
+                    self.checked_out[id(record['conn'])] = record
+                elif self._total() < self.max_size:
+                    # Место резервируем до открытия, чтобы не превысить max_size
+                    self.opening += 1
+                else:
+                    waited = True
+                    remaining = self.acquire_timeout - (now - started)
+                    if remaining <= 0:
+                        raise TimeoutError(f"Нет свободных соединений с Hive за {self.acquire_timeout} с")
+                    self.condition.wait(remaining)
+                    continue
+
+            for old in expired:
+                self._close(old)
+
+            if record is None:
+                try:
+                    record = self._open()
+                except Exception:
+                    with self.condition:
+                        self.opening -= 1
+                        self.condition.notify()
+                    raise
+                with self.condition:
+                    self.opening -= 1
+                    self.checked_out[id(record['conn'])] = record
+                    self.metrics['created'] += 1
+            elif not self._healthy(record):
+                with self.condition:
+                    self.checked_out.pop(id(record['conn']), None)
+                    self.condition.notify()
+                self._close(record)
+                continue
+
+            with self.condition:
+                wait_seconds = time.time() - started
+                self.metrics['acquired'] += 1
+                if waited:
+                    self.metrics['waits'] += 1
+                self.metrics['wait_seconds'] += wait_seconds
+                self.metrics['max_wait_seconds'] = max(self.metrics['max_wait_seconds'], wait_seconds)
+            return record['conn']
+
+    def release(self, conn, broken: bool = False) -> None:
+        """Возвращает соединение в пул. broken=True - закрыть его"""
+        with self.condition:
+            record = self.checked_out.pop(id(conn), None)
+            if record is not None and not broken:
+                record['last_used'] = time.time()
+                self.idle.append(record)
+            self.condition.notify()
+        if record is not None and broken:
+            self._close(record)
+
+    @contextmanager
+    def connection(self):
+        """with pool.connection() as cursor: ... - курсор уже в нужной базе"""
+        conn = self.acquire()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        except Exception:
+            # Ошибка могла быть и в запросе, и в соединении: проверим его при следующей выдаче
+            with self.condition:
+                record = self.checked_out.get(id(conn))
+                if record is not None:
+                    record['last_checked'] = 0
+            raise
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+            self.release(conn)
+
+    def stats(self) -> dict:
+        with self.condition:
+            stats = dict(self.metrics)
+            stats['idle'] = len(self.idle)
+            stats['in_use'] = len(self.checked_out)
+            stats['avg_wait_ms'] = round(1000 * stats['wait_seconds'] / stats['acquired'], 1) if stats['acquired'] else 0
+            return stats
+
+    def close_all(self) -> None:
+        with self.condition:
+            idle, self.idle = self.idle, []
+        for record in idle:
+            self._close(record)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(**kwargs) -> HivePool:
+    """Общий пул процесса. Параметры учитываются только при первом вызове"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HivePool(**kwargs)
+        return _pool
@@ -1,57 +1,145 @@
-import json
-import os
+import bisect
+import threading
+
+from output_loader import COLUMNS, load_records, print_load_stats, scan_changes
+
+# Колонки, для которых индекс сортировки поддерживается постоянно
+INDEXED_COLUMNS = ('positive_percentage', 'negative_percentage', 'total_reviews', 'restaurant_name', 'parsed_date')
+
 
 class HiveSimulator:
-    def __init__(self):
-        self.data = []
-        self.load_from_json()
-    
+    """Локальная замена таблицы restaurant_reviews без кластера Hive.
+
+    Данные хранятся по колонкам (список значений на колонку), для частых сортировок
+    поддерживаются отсортированные индексы, суммы для статистики ведутся на ходу.
+    Файлы читаются при первом обращении, refresh() дочитывает только новые и
+    измененные файлы, поэтому страница данных отдается за O(размер страницы).
+    """
+
+    def __init__(self, output_dir: str = "output"):
+        self.output_dir = output_dir
+        self.lock = threading.RLock()
+        self.columns = {column: [] for column in COLUMNS}
+        self.rows_by_file = {}  # имя файла -> (mtime, size, номер строки)
+        self.free_rows = []  # строки удаленных файлов, которые можно переиспользовать
+        self.indexes = {column: [] for column in INDEXED_COLUMNS}  # [(значение, номер строки)]
+        self.totals = {'restaurants': 0, 'reviews': 0, 'positive': 0, 'negative': 0, 'neutral': 0,
+                       'positive_percentage': 0.0}
+        self.loaded = False
+
+    @property
+    def data(self) -> list:
+        """Все строки в виде словарей (для совместимости со старым кодом)"""
+        return self.get_data()
+
+    def _ensure_loaded(self) -> None:
+        if not self.loaded:
+            self.refresh()
+
     def load_from_json(self):
-        if not os.path.exists("output"):
-            return
-        
-        json_files = [f for f in os.listdir("output") if f.endswith('.json')]
-        for json_file in json_files:
-            try:
-                with open(f"output/{json_file}", 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                restaurant_info = data.get('restaurant_info', {})
-                sentiment = data.get('sentiment_analysis', {})
-                
-                self.data.append({
-                    'restaurant_name': restaurant_info.get('name', 'Unknown'),
-                    'total_reviews': sentiment.get('total_comments', 0),
-                    'positive_reviews': sentiment.get('positive_count', 0),
-                    'negative_reviews': sentiment.get('negative_count', 0),
-                    'neutral_reviews': sentiment.get('neutral_count', 0),
-                    'positive_percentage': float(sentiment.get('positive_percentage', 0)),
-                    'negative_percentage': float(sentiment.get('negative_percentage', 0)),
-                    'parsed_date': restaurant_info.get('parsed_at', ''),
-                    'source_url': restaurant_info.get('url', '')
-                })
-            except:
-                continue
-    
-    def get_data(self):
-        """Возвращаем данные для веб-интерфейса"""
-        return sorted(self.data, key=lambda x: x['positive_percentage'], reverse=True)
-    
+        self.refresh()
+
+    def _account(self, row: int, sign: int) -> None:
+        self.totals['restaurants'] += sign
+        self.totals['reviews'] += sign * self.columns['total_reviews'][row]
+        self.totals['positive'] += sign * self.columns['positive_reviews'][row]
+        self.totals['negative'] += sign * self.columns['negative_reviews'][row]
+        self.totals['neutral'] += sign * self.columns['neutral_reviews'][row]
+        self.totals['positive_percentage'] += sign * self.columns['positive_percentage'][row]
+
+    def _remove(self, row: int) -> None:
+        self._account(row, -1)
+        for column, index in self.indexes.items():
+            position = bisect.bisect_left(index, (self.columns[column][row], row))
+            del index[position]
+        self.free_rows.append(row)
+
+    def _insert(self, record: dict) -> int:
+        if self.free_rows:
+            row = self.free_rows.pop()
+            for column in COLUMNS:
+                self.columns[column][row] = record[column]
+        else:
+            row = len(self.columns[COLUMNS[0]])
+            for column in COLUMNS:
+                self.columns[column].append(record[column])
+
+        for column, index in self.indexes.items():
+            bisect.insort(index, (record[column], row))
+        self._account(row, +1)
+        return row
+
+    def refresh(self) -> int:
+        """Дочитывает новые и измененные файлы, убирает удаленные. Возвращает число изменений"""
+        with self.lock:
+            self.loaded = True
+            known = {json_file: entry[:2] for json_file, entry in self.rows_by_file.items()}
+            current, removed, stale = scan_changes(self.output_dir, known)
+
+            changes = 0
+            for json_file in removed:
+                self._remove(self.rows_by_file.pop(json_file)[2])
+                changes += 1
+
+            if stale:
+                loaded = load_records(self.output_dir, stale)
+                print_load_stats(loaded)
+                for json_file in stale:
+                    record = loaded['records'].get(json_file)
+                    if record is None:
+                        continue
+                    known = self.rows_by_file.pop(json_file, None)
+                    if known:
+                        self._remove(known[2])
+                    self.rows_by_file[json_file] = current[json_file] + (self._insert(record),)
+                    changes += 1
+
+            return changes
+
+    def _row(self, row: int) -> dict:
+        return {column: self.columns[column][row] for column in COLUMNS}
+
+    def get_data(self, order_by: str = 'positive_percentage', descending: bool = True,
+                 offset: int = 0, limit: int = None):
+        """Возвращаем данные для веб-интерфейса (страницу offset/limit в нужном порядке)"""
+        with self.lock:
+            self._ensure_loaded()
+            if order_by in self.indexes:
+                index = self.indexes[order_by]
+                count = len(index)
+                end = count if limit is None else min(count, offset + limit)
+                if descending:
+                    rows = [index[count - 1 - i][1] for i in range(offset, end)]
+                else:
+                    rows = [index[i][1] for i in range(offset, end)]
+            else:
+                # Колонка без индекса - сортируем на лету
+                rows = sorted(
+                    (row for _, _, row in self.rows_by_file.values()),
+                    key=lambda row: self.columns[order_by][row],
+                    reverse=descending
+                )
+                rows = rows[offset:None if limit is None else offset + limit]
+            return [self._row(row) for row in rows]
+
     def get_stats(self):
         """Статистика"""
-        if not self.data:
-            return None
-            
-        total_restaurants = len(self.data)
-        total_reviews = sum(d['total_reviews'] for d in self.data)
-        avg_positive = sum(d['positive_percentage'] for d in self.data) / total_restaurants
-        
-        return {
-            'total_restaurants': total_restaurants,
-            'total_reviews': total_reviews,
-            'avg_positive': round(avg_positive, 2),
-            'total_comments': total_reviews * 10
-        }
+        with self.lock:
+            self._ensure_loaded()
+            total_restaurants = self.totals['restaurants']
+            if not total_restaurants:
+                return None
+
+            total_reviews = self.totals['reviews']
+            avg_positive = self.totals['positive_percentage'] / total_restaurants
+
+            return {
+                'total_restaurants': total_restaurants,
+                'total_reviews': total_reviews,
+                'avg_positive': round(avg_positive, 2),
+                'total_comments': total_reviews * 10
+            }
 
 
+# Файлы читаются при первом обращении, а не при импорте
 hive_sim = HiveSimulator()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import hashlib
+import os
+
+from catalog import org_id
+from json_stream import read_summary
+from output_format import iter_reviews
+
+
+def restaurant_key(url: str) -> str:
+    """Ключ ресторана: id организации из ссылки (параметры запроса не важны)"""
+    return org_id(url) or (url or '').split('?')[0].rstrip('/')
+
+
+def review_fingerprint(name: str, date: str, text: str) -> str:
+    """Стабильный отпечаток отзыва: автор + дата + хеш текста"""
+    text_hash = hashlib.sha1((text or '').encode('utf-8')).hexdigest()
+    return hashlib.sha1(f"{name}\x1f{date}\x1f{text_hash}".encode('utf-8')).hexdigest()[:20]
+
+
+def load_previous_results(output_dir: str = "output") -> dict:
+    """Собирает уже сохраненные отзывы по каждому ресторану.
+
+    Возвращает {ключ ресторана: {'file', 'parsed_at', 'fingerprints'}}, где file -
+    самый свежий результат (полный снимок ресторана), а fingerprints - отпечатки
+    отзывов из всех файлов этого ресторана.
+    """
+    previous = {}
+    if not os.path.exists(output_dir):
+        return previous
+
+    for json_file in os.listdir(output_dir):
+        if not json_file.endswith('.json'):
+            continue
+        try:
+            data = read_summary(os.path.join(output_dir, json_file))
+        except Exception as e:
+            print(f"❌ Ошибка чтения {json_file}: {str(e)[:50]}")
+            continue
+
+        restaurant_info = data.get('restaurant_info', {})
+        key = restaurant_key(restaurant_info.get('url', ''))
+        parsed_at = restaurant_info.get('parsed_at', '')
+
+        entry = previous.setdefault(key, {'file': None, 'parsed_at': '', 'fingerprints': set()})
+        if entry['file'] is None or parsed_at > entry['parsed_at']:
+            entry['file'] = json_file
+            entry['parsed_at'] = parsed_at
+
+        try:
+            for _, comment in iter_reviews(os.path.join(output_dir, json_file), data):
+                entry['fingerprints'].add(review_fingerprint(
+                    comment.get('name', ''), comment.get('date', ''), comment.get('text', '')
+                ))
+        except Exception as e:
+            print(f"❌ Ошибка чтения отзывов {json_file}: {str(e)[:50]}")
+
+    return previous
+
+
+def previous_reviews(entry: dict, output_dir: str = "output") -> list:
+    """Отзывы из самого свежего файла ресторана - основа для нового полного снимка.
+
+    Ошибку чтения не глушим: снимок без старых отзывов исказил бы статистику ресторана.
+    """
+    reviews = []
+    for _, comment in iter_reviews(os.path.join(output_dir, entry['file'])):
+        reviews.append({
+            'name': comment.get('name', ''),
+            'stars': comment.get('stars', 0),
+            'date': comment.get('date', ''),
+            'text': comment.get('text', '')
+        })
+    return reviews
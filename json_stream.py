@@ -0,0 +1,161 @@
+import json
+import re
+
+# Потоковое чтение файлов результата без построения всего дерева JSON.
+# В памяти держится только текущее значение верхнего уровня (или один отзыв),
+# поэтому расход памяти не зависит от числа отзывов в файле.
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = ' \t\n\r'
+NUMBER_CHARS = '0123456789.eE+-'
+# Токены для пропуска значения: строка целиком, скобка или начало недочитанной строки
+SKIP_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"', re.DOTALL)
+
+# Ключи, которых хватает для сводки по ресторану
+SUMMARY_KEYS = ('restaurant_info', 'sentiment_analysis')
+
+_decoder = json.JSONDecoder()
+
+
+class StreamReader:
+    """Читает JSON из файла кусками, разбирая по одному значению за раз"""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Дочитывает кусок файла, отбрасывая уже разобранное начало буфера"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message: str):
+        return ValueError(f"Некорректный JSON: {message}")
+
+    def skip_ws(self) -> None:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        self.skip_ws()
+        if self.pos >= len(self.buf):
+            raise self._error("неожиданный конец файла")
+        return self.buf[self.pos]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"ожидался '{char}', найден '{self.buf[self.pos]}'")
+        self.pos += 1
+
+    def read_value(self):
+        """Разбирает одно значение целиком"""
+        self.skip_ws()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Число на границе куска могло оборваться ("12" из "12.5"): дочитываем и разбираем заново
+            cut = end == len(self.buf) or (
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                and self.buf[end] in NUMBER_CHARS
+            )
+            if cut and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Пропускает значение, не разбирая его"""
+        char = self.peek()
+        if char not in '{[':
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            for match in SKIP_TOKEN_RE.finditer(self.buf, self.pos):
+                token = match.group()
+                if token == '"':
+                    # Строка обрывается на конце буфера
+                    self.pos = match.start()
+                    break
+                self.pos = match.end()
+                if token in '{[':
+                    depth += 1
+                elif token in '}]':
+                    depth -= 1
+                    if depth == 0:
+                        return
+            else:
+                self.pos = len(self.buf)
+            if not self._fill():
+                raise self._error("неожиданный конец файла")
+
+    def iter_object(self):
+        """Перебирает ключи объекта; после каждого ключа значение нужно прочитать или пропустить"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise self._error("ключ объекта должен быть строкой")
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise self._error(f"ожидалась ',' или '}}', найден '{char}'")
+
+
+def read_summary(path: str, keys: tuple = None, chunk_size: int = CHUNK_SIZE) -> dict:
+    """Ключи верхнего уровня без user_comments.
+
+    keys - какие ключи нужны (None - все, кроме user_comments). Чтение
+    останавливается, как только все нужные ключи найдены.
+    """
+    wanted = set(keys) if keys else None
+    result = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = StreamReader(f, chunk_size)
+        for key in reader.iter_object():
+            if (wanted is None and key != 'user_comments') or (wanted and key in wanted):
+                result[key] = reader.read_value()
+                if wanted is not None and wanted.issubset(result):
+                    break
+            else:
+                reader.skip_value()
+    return result
+
+
+def iter_comments(path: str, chunk_size: int = CHUNK_SIZE):
+    """Перебирает (review_id, отзыв) из user_comments по одному"""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = StreamReader(f, chunk_size)
+        for key in reader.iter_object():
+            if key != 'user_comments':
+                reader.skip_value()
+                continue
+            for review_id in reader.iter_object():
+                yield review_id, reader.read_value()
+            return
+
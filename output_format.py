@@ -0,0 +1,159 @@
+import gzip
+import json
+import os
+
+from json_stream import iter_comments, read_summary
+
+
+# Компактный формат: маленький summary-файл reviews_<name>_<ts>.json и отдельное тело
+# reviews_<name>_<ts>.reviews.jsonl[.gz|.zst] с одним отзывом на строку.
+# Списки positive/negative/neutral_comments в summary хранят только id отзывов.
+COMPACT_FORMAT = 'compact'
+DISPLAY_LISTS = {
+    'positive_comments': 'positive',
+    'negative_comments': 'negative',
+    'neutral_comments': 'neutral'
+}
+BODY_EXTENSIONS = {
+    None: '.reviews.jsonl',
+    'gzip': '.reviews.jsonl.gz',
+    'zstd': '.reviews.jsonl.zst'
+}
+
+
+def compression_of(path: str) -> str:
+    """Сжатие тела по расширению файла (None - без сжатия)"""
+    if path.endswith('.gz'):
+        return 'gzip'
+    if path.endswith('.zst'):
+        return 'zstd'
+    return None
+
+
+def _open_body(path: str, mode: str, compression: str = None):
+    """Открывает тело с отзывами в текстовом режиме с учетом сжатия"""
+    if compression == 'gzip':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("Для .zst нужен пакет zstandard: pip install zstandard")
+        import io
+        raw = open(path, mode + 'b')
+        if mode == 'w':
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def body_path(summary_path: str, compression: str = None) -> str:
+    base = summary_path[:-len('.json')] if summary_path.endswith('.json') else summary_path
+    return base + BODY_EXTENSIONS[compression]
+
+
+def is_compact(data: dict) -> bool:
+    return data.get('format') == COMPACT_FORMAT
+
+
+def write_result(result: dict, output_path: str, compact: bool = False, compression: str = None) -> None:
+    """Сохраняет результат парсинга (обычный JSON или компактный формат).
+
+    Файлы пишутся через временный файл и os.replace, чтобы читатели не увидели половину.
+    """
+    if not compact:
+        tmp_path = output_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, output_path)
+        return
+
+    user_comments = result.get('user_comments', {})
+    body = body_path(output_path, compression)
+
+    # Сначала тело, затем summary: summary не должен ссылаться на несуществующий файл
+    tmp_body = body + '.tmp'
+    with _open_body(tmp_body, 'w', compression) as f:
+        for review_id, comment in user_comments.items():
+            f.write(json.dumps({'id': review_id, **comment}, ensure_ascii=False) + '\n')
+    os.replace(tmp_body, body)
+
+    summary = {key: value for key, value in result.items() if key != 'user_comments'}
+    summary['format'] = COMPACT_FORMAT
+    summary['reviews_file'] = os.path.basename(body)
+    for list_name, sentiment in DISPLAY_LISTS.items():
+        if list_name not in result:
+            continue
+        # Списки для отображения - первые отзывы каждой тональности, храним ссылки на них
+        limit = len(result[list_name])
+        summary[list_name] = [
+            review_id for review_id, comment in user_comments.items()
+            if comment.get('sentiment') == sentiment
+        ][:limit]
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, output_path)
+
+
+def iter_reviews(path: str, data: dict = None):
+    """Перебирает (review_id, отзыв) из файла результата в любом формате.
+
+    data - уже прочитанный summary; если в нем нет user_comments, отзывы
+    читаются из файла потоково, по одному.
+    """
+    if data is None:
+        data = read_summary(path)
+
+    if not is_compact(data):
+        if 'user_comments' in data:
+            yield from data['user_comments'].items()
+        else:
+            yield from iter_comments(path)
+        return
+
+    body = os.path.join(os.path.dirname(path), data['reviews_file'])
+    with _open_body(body, 'r', compression_of(body)) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            comment = json.loads(line)
+            review_id = comment.pop('id')
+            yield review_id, comment
+
+
+def load_result(path: str) -> tuple:
+    """Читает результат целиком в обычном виде.
+
+    Возвращает (данные, параметры формата для write_result), чтобы файл можно было
+    перезаписать в том же формате.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if not is_compact(data):
+        return data, {'compact': False, 'compression': None}
+
+    options = {'compact': True, 'compression': compression_of(data['reviews_file'])}
+    user_comments = dict(iter_reviews(path, data))
+    for list_name in DISPLAY_LISTS:
+        if list_name in data:
+            data[list_name] = [
+                {
+                    'name': user_comments[review_id]['name'],
+                    'text': user_comments[review_id]['text'][:300],
+                    'stars': user_comments[review_id]['stars'],
+                    'date': user_comments[review_id]['date']
+                }
+                for review_id in data[list_name] if review_id in user_comments
+            ]
+
+    data.pop('format', None)
+    data.pop('reviews_file', None)
+    result = {'restaurant_info': data.pop('restaurant_info', {}), 'user_comments': user_comments}
+    result.update(data)
+    return result, options
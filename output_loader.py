@@ -0,0 +1,140 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from json_stream import SUMMARY_KEYS, read_summary
+
+# Девять колонок restaurant_reviews (hive_loader, HiveSimulator, storage, web_hive)
+COLUMNS = (
+    'restaurant_name', 'total_reviews', 'positive_reviews', 'negative_reviews', 'neutral_reviews',
+    'positive_percentage', 'negative_percentage', 'parsed_date', 'source_url'
+)
+
+# Чтение файлов упирается в диск, а не в CPU, поэтому потоков больше, чем ядер
+DEFAULT_WORKERS = int(os.environ.get('LOADER_WORKERS', min(32, (os.cpu_count() or 1) * 4)))
+
+
+def restaurant_record(data: dict) -> dict:
+    """Строка restaurant_reviews из summary файла результата парсера"""
+    restaurant_info = data.get('restaurant_info', {})
+    sentiment = data.get('sentiment_analysis', {})
+    return {
+        'restaurant_name': restaurant_info.get('name', 'Unknown'),
+        'total_reviews': sentiment.get('total_comments', 0),
+        'positive_reviews': sentiment.get('positive_count', 0),
+        'negative_reviews': sentiment.get('negative_count', 0),
+        'neutral_reviews': sentiment.get('neutral_count', 0),
+        'positive_percentage': float(sentiment.get('positive_percentage', 0)),
+        'negative_percentage': float(sentiment.get('negative_percentage', 0)),
+        'parsed_date': restaurant_info.get('parsed_at') or '',
+        'source_url': restaurant_info.get('url', '')
+    }
+
+
+def record_values(record: dict) -> tuple:
+    """Запись в порядке колонок таблицы (для INSERT)"""
+    return tuple(record[column] for column in COLUMNS)
+
+
+def list_json_files(output_dir: str) -> list:
+    if not os.path.exists(output_dir):
+        return []
+    return sorted(f for f in os.listdir(output_dir) if f.endswith('.json'))
+
+
+def scan_output(output_dir: str) -> dict:
+    """{имя *.json: (mtime, size)} по файлам в output_dir"""
+    current = {}
+    if os.path.exists(output_dir):
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    stat = entry.stat()
+                    current[entry.name] = (stat.st_mtime, stat.st_size)
+    return current
+
+
+def scan_changes(output_dir: str, known: dict) -> tuple:
+    """Сверяет папку с уже загруженными версиями файлов {имя: (mtime, size)}.
+
+    Возвращает (текущие версии, удаленные файлы, новые и измененные файлы) -
+    общая основа для инкрементальных кэшей (web_hive, storage, HiveSimulator)
+    """
+    current = scan_output(output_dir)
+    removed = [json_file for json_file in known if json_file not in current]
+    stale = [json_file for json_file, key in current.items() if known.get(json_file) != key]
+    return current, removed, stale
+
+
+def _load_one(path: str, with_summary: bool) -> dict:
+    # Для записи хватает двух ключей; полный summary нужен, если дальше читаются отзывы
+    data = read_summary(path) if with_summary else read_summary(path, SUMMARY_KEYS)
+    loaded = {'record': restaurant_record(data), 'bytes': os.path.getsize(path)}
+    if with_summary:
+        loaded['summary'] = data
+    return loaded
+
+
+def load_records(output_dir: str = "output", files: list = None, workers: int = None,
+                 with_summary: bool = False) -> dict:
+    """Читает файлы результата параллельно на пуле потоков.
+
+    files - имена файлов в output_dir (None - все *.json). Возвращает
+    {'records': {имя: запись}, 'summaries': {имя: summary} (если with_summary),
+    'errors': {имя: текст ошибки}, 'stats': {...}}
+    """
+    if files is None:
+        files = list_json_files(output_dir)
+    workers = max(1, min(workers or DEFAULT_WORKERS, len(files) or 1))
+
+    started = time.time()
+    records, summaries, errors = {}, {}, {}
+    total_bytes = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='loader') as pool:
+        futures = {
+            json_file: pool.submit(_load_one, os.path.join(output_dir, json_file), with_summary)
+            for json_file in files
+        }
+        for json_file, future in futures.items():
+            try:
+                loaded = future.result()
+            except Exception as e:
+                errors[json_file] = str(e)
+                continue
+            records[json_file] = loaded['record']
+            total_bytes += loaded['bytes']
+            if with_summary:
+                summaries[json_file] = loaded['summary']
+
+    elapsed = time.time() - started
+    result = {
+        'records': records,
+        'errors': errors,
+        'stats': {
+            'files': len(records),
+            'errors': len(errors),
+            'workers': workers,
+            'seconds': round(elapsed, 3),
+            'files_per_second': round(len(records) / elapsed, 1) if elapsed > 0 else 0,
+            'mb_per_second': round(total_bytes / 2 ** 20 / elapsed, 1) if elapsed > 0 else 0
+        }
+    }
+    if with_summary:
+        result['summaries'] = summaries
+    return result
+
+
+def print_load_stats(result: dict) -> None:
+    stats = result['stats']
+    for json_file, error in result['errors'].items():
+        print(f"❌ Ошибка чтения {json_file}: {error[:50]}")
+    if stats['files'] or stats['errors']:
+        print(f"📥 Прочитано файлов: {stats['files']} за {stats['seconds']:.2f} с "
+              f"({stats['files_per_second']} файлов/с, {stats['mb_per_second']} МБ/с, потоков: {stats['workers']})")
+
+
+if __name__ == "__main__":
+    import sys
+
+    result = load_records(sys.argv[1] if len(sys.argv) > 1 else "output")
+    print_load_stats(result)
@@ -0,0 +1,149 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# Одним запросом получаем количество отзывов и высоту прокручиваемой области
+PROBE_SCRIPT = """
+    var reviews = document.querySelectorAll(arguments[0]).length;
+    var element = document.querySelector(arguments[1]);
+    var height = element ? element.scrollHeight : document.body.scrollHeight;
+    return [reviews, height];
+"""
+
+# Состояние страницы сразу после driver.get: готовность документа, отзывы и признак "отзывов нет"
+READY_SCRIPT = """
+    var empty = arguments[1] ? document.querySelector(arguments[1]) !== null : false;
+    return [document.readyState, document.querySelectorAll(arguments[0]).length, empty];
+"""
+
+
+class PageWaiter:
+    """Ожидания по состоянию страницы вместо фиксированных time.sleep.
+
+    Ждем ровно до тех пор, пока на странице что-то не изменится
+    (появились новые отзывы, выросла высота, пропала кнопка), но не дольше таймаута.
+    По каждой странице копится статистика: сколько ждали и сколько раз уперлись в таймаут.
+
+    eager - страница грузится с page_load_strategy='eager' (облегченный профиль): документ
+    считается готовым уже в состоянии 'interactive', событие load не ждем.
+    Если документ готов, а отзывов нет дольше empty_grace секунд (или найден
+    empty_selector), страница считается пустой и таймаут не выжидается.
+    """
+
+    def __init__(self, driver, review_selector: str = '.business-review-view',
+                 scroll_selector: str = '.business-reviews-card-view__reviews',
+                 page_timeout: float = 15, scroll_timeout: float = 6,
+                 settle_time: float = 1.0, poll_interval: float = 0.25,
+                 eager: bool = False, empty_grace: float = 3.0, empty_selector: str = None):
+        self.driver = driver
+        self.review_selector = review_selector
+        self.scroll_selector = scroll_selector
+        self.page_timeout = page_timeout
+        self.scroll_timeout = scroll_timeout
+        self.settle_time = settle_time
+        self.poll_interval = poll_interval
+        self.ready_states = ('interactive', 'complete') if eager else ('complete',)
+        self.empty_grace = empty_grace
+        self.empty_selector = empty_selector
+        self.stats = {}
+        self.start_page()
+
+    def start_page(self) -> None:
+        """Сбрасывает статистику перед новой страницей"""
+        self.stats = {
+            'page_load_seconds': 0.0,
+            'scroll_wait_seconds': 0.0,
+            'button_wait_seconds': 0.0,
+            'settle_seconds': 0.0,
+            'waits': 0,
+            'timeouts': 0,
+            'no_reviews': False
+        }
+
+    def probe(self) -> tuple:
+        """(количество отзывов, высота области прокрутки)"""
+        reviews, height = self.driver.execute_script(PROBE_SCRIPT, self.review_selector, self.scroll_selector)
+        return reviews, height
+
+    def _wait(self, condition, timeout: float, stat: str) -> bool:
+        started = time.time()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval).until(condition)
+            return True
+        except TimeoutException:
+            self.stats['timeouts'] += 1
+            return False
+        finally:
+            self.stats[stat] += time.time() - started
+            self.stats['waits'] += 1
+
+    def wait_for_page(self) -> bool:
+        """После driver.get: ждем готовность документа и первые отзывы.
+
+        True - отзывы появились или страница точно без отзывов (stats['no_reviews']),
+        False - уперлись в page_timeout
+        """
+        state = {'ready_since': None}
+
+        def loaded(driver):
+            ready_state, reviews, empty = driver.execute_script(
+                READY_SCRIPT, self.review_selector, self.empty_selector
+            )
+            if ready_state not in self.ready_states:
+                return False
+            if reviews > 0:
+                return True
+            # Документ готов, а отзывов нет: явный признак или слишком долгое ожидание
+            now = time.time()
+            if state['ready_since'] is None:
+                state['ready_since'] = now
+            if empty or now - state['ready_since'] >= self.empty_grace:
+                self.stats['no_reviews'] = True
+                return True
+            return False
+
+        return self._wait(loaded, self.page_timeout, 'page_load_seconds')
+
+    def wait_for_growth(self, last_count: int, last_height: int) -> bool:
+        """После прокрутки: ждем новые отзывы или рост высоты"""
+        def grown(driver):
+            count, height = self.probe()
+            return count > last_count or height > last_height
+
+        return self._wait(grown, self.scroll_timeout, 'scroll_wait_seconds')
+
+    def wait_for_button_gone(self, button, last_count: int, last_height: int) -> bool:
+        """После клика "Показать ещё": ждем пока кнопка пропадет или подгрузятся отзывы"""
+        def done(driver):
+            try:
+                if not button.is_displayed():
+                    return True
+            except Exception:
+                # Элемент удален из DOM
+                return True
+            count, height = self.probe()
+            return count > last_count or height > last_height
+
+        return self._wait(done, self.scroll_timeout, 'button_wait_seconds')
+
+    def wait_for_stable(self) -> bool:
+        """Ждем пока высота страницы перестанет меняться в течение settle_time"""
+        state = {'height': None, 'since': time.time()}
+
+        def stable(driver):
+            height = self.probe()[1]
+            now = time.time()
+            if height != state['height']:
+                state['height'] = height
+                state['since'] = now
+                return False
+            return now - state['since'] >= self.settle_time
+
+        return self._wait(stable, self.scroll_timeout, 'settle_seconds')
+
+    def summary(self) -> dict:
+        """Статистика ожиданий по текущей странице (секунды округлены)"""
+        return {key: round(value, 2) if isinstance(value, float) else value
+                for key, value in self.stats.items()}
@@ -2,88 +2,49 @@ import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
-import json
 from selenium.common.exceptions import NoSuchElementException
 from typing import Union
 import re
 import os
+from chrome_profile import apply_lean_options, collect_page_metrics, enable_request_blocking, reset_page_metrics
+from incremental import load_previous_results, previous_reviews, restaurant_key, review_fingerprint
+from output_format import write_result
+from page_waits import PageWaiter
+from sentiment import SentimentAnalyzer
 
 
-class RestaurantReviewParser:
-    def __init__(self, driver):
+class RestaurantReviewParser(SentimentAnalyzer):
+    def __init__(self, driver, extraction_mode: str = 'page', waiter: PageWaiter = None,
+                 previous_results: dict = None, page_metrics: bool = False,
+                 compact: bool = False, compression: str = None):
+        # Списки ключевых слов и тональность - в sentiment.py (нужны и без браузера)
+        super().__init__()
         self.driver = driver
-        # Увеличил списки ключевых слов
-        self.positive_keywords = [
-            'отлично', 'прекрасно', 'хорошо', 'рекомендую', 'супер', 
-            'отличный', 'замечательно', 'великолепно', 'восхитительно',
-            'удовлетворен', 'понравилось', 'люблю', 'обожаю', 'восторг',
-            'прекрасный', 'хороший', 'отличное', 'класс', 'топ', 'лучший',
-            'вкусно', 'вкусный', 'уютно', 'чисто', 'быстро', 'вежливо',
-            'потрясающе', 'шикарно', 'безупречно', 'идеально', 'нравится',
-            'доволен', 'приятно', 'восхищение', 'наслаждение', 'обалденно',
-            'превосходно', 'сказочно', 'чудесно', 'невероятно', 'фантастически',
-            'кайф', 'удовольствие', 'рад', 'счастлив', 'довольна'
-        ]
-        self.negative_keywords = [
-            'плохо', 'ужасно', 'отвратительно', 'недоволен', 'не рекомендую',
-            'кошмар', 'разочарован', 'жутко', 'гадость', 'отвратительный',
-            'плохой', 'неприятно', 'отвратительное', 'ужасный', 'не понравилось',
-            'ненавижу', 'отвращение', 'ужас', 'позор', 'отвратно', 'грубо',
-            'грязно', 'долго', 'дорого', 'пересолено', 'недоварено', 'пережарено',
-            'несвежий', 'неопрятно', 'хамство', 'бесит', 'раздражает', 'зря',
-            'напутали', 'перепутали', 'обманули', 'кинули', 'обсчитали',
-            'переплатил', 'недовольна', 'злюсь', 'бесит', 'возмущена'
-        ]
+        # Ожидания по состоянию страницы (таймауты настраиваются в PageWaiter)
+        self.waiter = waiter or PageWaiter(driver)
+        # Считать трафик и время загрузки (нужен облегченный профиль с логом сети)
+        self.page_metrics = page_metrics
+        # 'page' - один разбор всей страницы, 'element' - поштучно через Selenium
+        self.extraction_mode = extraction_mode
+        # Результат load_previous_results() для инкрементального режима (None - парсим все)
+        self.previous_results = previous_results
+        # Путь к файлу последнего сохраненного результата
+        self.last_output_path = None
+        # Компактный формат: summary + отзывы отдельным JSON Lines (см. output_format.py)
+        self.compact = compact
+        self.compression = compression
 
-    def analyze_sentiment(self, text: str) -> dict:
-        if not text or not isinstance(text, str):
-            return {
-                'sentiment': 'neutral',
-                'score': 0,
-                'positive_words': [],
-                'negative_words': []
-            }
-        
-        text_lower = text.lower()
-        
-        # Ищем слова с границами слов
-        found_positive = []
-        for word in self.positive_keywords:
-            pattern = r'\b' + re.escape(word) + r'\b'
-            if re.search(pattern, text_lower):
-                found_positive.append(word)
-        
-        found_negative = []
-        for word in self.negative_keywords:
-            pattern = r'\b' + re.escape(word) + r'\b'
-            if re.search(pattern, text_lower):
-                found_negative.append(word)
-        
-        # Считаем вес: позитивные слова дают +2, негативные -2
-        score = (len(found_positive) * 2) - (len(found_negative) * 2)
-        
-        # Определяем тональность
-        if score >= 2:  # Если есть хотя бы 1 позитивное слово без негативных
-            sentiment = 'positive'
-        elif score <= -2:  # Если есть хотя бы 1 негативное слово без позитивных
-            sentiment = 'negative'
-        else:
-            sentiment = 'neutral'
-        
-        return {
-            'sentiment': sentiment,
-            'score': score,
-            'positive_words': found_positive,
-            'negative_words': found_negative,
-            'text_length': len(text)
-        }
-
-    def scroll_to_bottom(self, scroll_element_class: str, max_scrolls: int = 10) -> None:
+    def scroll_to_bottom(self, scroll_element_class: str, max_scrolls: int = 10, stop_condition=None) -> None:
         print("Начинаем прокрутку для загрузки всех отзывов...")
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        last_count, last_height = self.waiter.probe()
         scroll_attempts = 0
         
         while scroll_attempts < max_scrolls:
+            # В инкрементальном режиме дальше уже сохраненных отзывов не листаем
+            if stop_condition and stop_condition():
+                print("Дошли до уже сохраненных отзывов, прокрутку останавливаем")
+                break
+            
             self.driver.execute_script(f"""
                 var element = document.querySelector('{scroll_element_class}');
                 if (element) {{
@@ -93,20 +54,21 @@ class RestaurantReviewParser:
                 }}
             """)
             
-            time.sleep(3)  # Увеличил время ожидания
+            # Ждем появления новых отзывов вместо фиксированной паузы
+            grew = self.waiter.wait_for_growth(last_count, last_height)
             
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            last_count, last_height = self.waiter.probe()
+            if not grew:
                 try:
                     show_more_button = self.driver.find_element(By.XPATH, 
                         "//button[contains(text(), 'Показать ещё') or contains(text(), 'Ещё отзывы')]")
                     show_more_button.click()
                     print("Нажата кнопка 'Показать ещё'")
-                    time.sleep(3)
+                    self.waiter.wait_for_button_gone(show_more_button, last_count, last_height)
+                    last_count, last_height = self.waiter.probe()
                 except:
                     break
             
-            last_height = new_height
             scroll_attempts += 1
             print(f"Прокрутка {scroll_attempts}/{max_scrolls} завершена")
         
@@ -124,6 +86,191 @@ class RestaurantReviewParser:
             star_count = star_count + 1
         return star_count
 
+    def extract_review(self, soup, review_element=None) -> dict:
+        """Достает имя, дату, текст и звезды из HTML одного отзыва.
+
+        review_element - элемент Selenium, если отзыв разбирается поштучно
+        (нужен только для запасного поиска текста).
+        """
+        # Имя пользователя
+        name = "Аноним"
+        try:
+            name_element = soup.select_one('.business-review-view__author')
+            if name_element:
+                name_link = name_element.find('a')
+                if name_link:
+                    name = name_link.text.strip()
+                else:
+                    name = name_element.text.strip()
+        except:
+            pass
+        
+        # Дата отзыва
+        date = ""
+        try:
+            date_element = soup.select_one('.business-review-view__date')
+            if date_element:
+                date = date_element.text.strip()
+        except:
+            pass
+        
+        # Текст отзыва
+        text = ""
+        try:
+            text_element = soup.select_one('.business-review-view__body-text')
+            if text_element:
+                text = text_element.text.strip()
+            else:
+                if review_element is not None:
+                    text_element = review_element.find_element(By.CSS_SELECTOR, '[class*="body"]')
+                else:
+                    text_element = soup.select_one('[class*="body"]')
+                text = text_element.text.strip()
+        except:
+            try:
+                # Берем только начало если не нашли нормально
+                if review_element is not None:
+                    text = review_element.text[:500]
+                else:
+                    text = soup.get_text()[:500]
+            except:
+                pass
+        
+        # Оценка (звезды)
+        stars = 0
+        try:
+            stars_container = soup.select_one('.business-rating-badge-view__stars')
+            if stars_container:
+                star_elements = stars_container.find_all('span')
+                stars = self.get_count_star(star_elements)
+            else:
+                rating_text = soup.select_one('.business-rating-badge-view__rating-text')
+                if rating_text:
+                    try:
+                        stars = float(rating_text.text.strip())
+                    except:
+                        pass
+        except:
+            pass
+        
+        # Пропускаем отзывы без текста или с мусором
+        if not text or len(text.strip()) < 10 or text == "Подписаться":
+            return None
+        
+        return {
+            'name': name,
+            'stars': stars,
+            'date': date,
+            'text': text
+        }
+
+    def collect_reviews(self, items: list, extract) -> list:
+        """Прогоняет извлечение по всем найденным отзывам"""
+        reviews = []
+        review_count = 0
+        
+        print(f"Обрабатываем {len(items)} отзывов...")
+        
+        # УБРАЛ ОГРАНИЧИТЕЛЬ [:15] - теперь обрабатываем ВСЕ
+        for i, item in enumerate(items):
+            try:
+                review = extract(item)
+                if review is None:
+                    continue
+                
+                # Тональность считаем потом одной пачкой
+                reviews.append(review)
+                review_count += 1
+                
+                if review_count % 10 == 0:
+                    print(f"  Обработано отзывов: {review_count}/{len(items)}")
+                
+            except Exception as e:
+                if review_count % 20 == 0:  # Не спамим ошибками
+                    print(f"  Пропущен отзыв {i}: {str(e)[:50]}...")
+                continue
+        
+        return reviews
+
+    def extract_reviews_from_html(self, html: str) -> tuple:
+        """Разбирает HTML страницы (или контейнера отзывов) за один проход"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        review_nodes = soup.select('.business-review-view')
+        print(f"Найдено элементов отзывов: {len(review_nodes)}")
+        
+        if len(review_nodes) < 10:
+            # Пробуем альтернативный селектор
+            alt_reviews = soup.select('[class*="review"]')
+            print(f"Альтернативный поиск: найдено {len(alt_reviews)} элементов")
+            if len(alt_reviews) > len(review_nodes):
+                review_nodes = alt_reviews
+        
+        return len(review_nodes), self.collect_reviews(review_nodes, self.extract_review)
+
+    def extract_reviews_from_elements(self) -> tuple:
+        """Старый режим: каждый отзыв прокручивается и выгружается из браузера отдельно"""
+        reviews_elements = self.driver.find_elements(By.CSS_SELECTOR, '.business-review-view')
+        print(f"Найдено элементов отзывов: {len(reviews_elements)}")
+        
+        if len(reviews_elements) < 10:
+            # Пробуем альтернативный селектор
+            alt_reviews = self.driver.find_elements(By.CSS_SELECTOR, '[class*="review"]')
+            print(f"Альтернативный поиск: найдено {len(alt_reviews)} элементов")
+            if len(alt_reviews) > len(reviews_elements):
+                reviews_elements = alt_reviews
+        
+        def extract(review_element):
+            # Прокручиваем к элементу
+            # Мгновенная прокрутка: ждать окончания анимации не нужно
+            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", review_element)
+            
+            review_html = review_element.get_attribute('outerHTML')
+            soup = BeautifulSoup(review_html, 'html.parser')
+            return self.extract_review(soup, review_element)
+        
+        return len(reviews_elements), self.collect_reviews(reviews_elements, extract)
+
+    def known_reviews_check(self, fingerprints: set):
+        """Условие остановки прокрутки: на странице появился уже сохраненный отзыв.
+
+        При каждом вызове из браузера забираются только новые с прошлого раза отзывы.
+        """
+        state = {'checked': 0}
+        
+        def seen_known() -> bool:
+            html_list = self.driver.execute_script("""
+                var nodes = document.querySelectorAll(arguments[0]);
+                var out = [];
+                for (var i = arguments[1]; i < nodes.length; i++) {
+                    out.push(nodes[i].outerHTML);
+                }
+                return out;
+            """, '.business-review-view', state['checked'])
+            state['checked'] += len(html_list)
+            
+            for review_html in html_list:
+                review = self.extract_review(BeautifulSoup(review_html, 'html.parser'))
+                if review and review_fingerprint(review['name'], review['date'], review['text']) in fingerprints:
+                    return True
+            return False
+        
+        return seen_known
+
+    def save_result(self, result: dict) -> str:
+        """Сохраняет результат в output/ и возвращает путь к файлу"""
+        restaurant_name = result['restaurant_info']['name']
+        safe_name = re.sub(r'[^\w\s-]', '', restaurant_name).strip().replace(' ', '_')
+        filename = f"reviews_{safe_name}_{int(time.time())}.json"
+        
+        output_dir = "output"
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, filename)
+        
+        write_result(result, output_path, compact=self.compact, compression=self.compression)
+        
+        return output_path
+
     def parse_restaurant_reviews(self, url: str, restaurant_name: str = None) -> dict:
         print(f"\n{'='*80}")
         print(f"НАЧИНАЕМ ПАРСИНГ ОТЗЫВОВ")
@@ -133,8 +280,14 @@ class RestaurantReviewParser:
         print(f"{'='*80}")
         
         try:
+            self.waiter.start_page()
+            if self.page_metrics:
+                reset_page_metrics(self.driver)
             self.driver.get(url)
-            time.sleep(5)
+            if not self.waiter.wait_for_page():
+                print("⚠️  Отзывы не появились за отведенное время, продолжаем как есть")
+            elif self.waiter.stats['no_reviews']:
+                print("ℹ️  На странице нет отзывов")
             
             if not restaurant_name:
                 try:
@@ -144,176 +297,40 @@ class RestaurantReviewParser:
                 except:
                     restaurant_name = "Неизвестный ресторан"
             
-            print("Загружаем все отзывы...")
-            self.scroll_to_bottom('.business-reviews-card-view__reviews', max_scrolls=8)
-            time.sleep(3)
-            
-            reviews_elements = self.driver.find_elements(By.CSS_SELECTOR, '.business-review-view')
-            print(f"Найдено элементов отзывов: {len(reviews_elements)}")
+            # Инкрементальный режим: что уже сохранено по этому ресторану
+            previous = None
+            if self.previous_results is not None:
+                previous = self.previous_results.get(restaurant_key(url))
             
-            if len(reviews_elements) < 10:
-                # Пробуем альтернативный селектор
-                alt_reviews = self.driver.find_elements(By.CSS_SELECTOR, '[class*="review"]')
-                print(f"Альтернативный поиск: найдено {len(alt_reviews)} элементов")
-                if len(alt_reviews) > len(reviews_elements):
-                    reviews_elements = alt_reviews
+            if not self.waiter.stats['no_reviews']:
+                print("Загружаем все отзывы...")
+                stop_condition = self.known_reviews_check(previous['fingerprints']) if previous else None
+                self.scroll_to_bottom('.business-reviews-card-view__reviews', max_scrolls=8,
+                                      stop_condition=stop_condition)
+                self.waiter.wait_for_stable()
             
-            user_comments = {}
-            positive_comments = []
-            negative_comments = []
-            neutral_comments = []
+            if self.extraction_mode == 'page':
+                # Одна выгрузка HTML и один разбор вместо запросов к каждому отзыву
+                found_count, reviews = self.extract_reviews_from_html(self.driver.page_source)
+            else:
+                found_count, reviews = self.extract_reviews_from_elements()
             
-            review_count = 0
-            
-            print(f"Обрабатываем {len(reviews_elements)} отзывов...")
-            
-            # УБРАЛ ОГРАНИЧИТЕЛЬ [:15] - теперь обрабатываем ВСЕ
-            for i, review_element in enumerate(reviews_elements):
-                try:
-                    # Прокручиваем к элементу
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", review_element)
-                    time.sleep(0.3)
-                    
-                    review_html = review_element.get_attribute('outerHTML')
-                    soup = BeautifulSoup(review_html, 'html.parser')
-                    
-                    # Имя пользователя
-                    name = "Аноним"
-                    try:
-                        name_element = soup.select_one('.business-review-view__author')
-                        if name_element:
-                            name_link = name_element.find('a')
-                            if name_link:
-                                name = name_link.text.strip()
-                            else:
-                                name = name_element.text.strip()
-                    except:
-                        pass
-                    
-                    # Дата отзыва
-                    date = ""
-                    try:
-                        date_element = soup.select_one('.business-review-view__date')
-                        if date_element:
-                            date = date_element.text.strip()
-                    except:
-                        pass
-                    
-                    # Текст отзыва
-                    text = ""
-                    try:
-                        text_element = soup.select_one('.business-review-view__body-text')
-                        if text_element:
-                            text = text_element.text.strip()
-                        else:
-                            text_element = review_element.find_element(By.CSS_SELECTOR, '[class*="body"]')
-                            text = text_element.text.strip()
-                    except:
-                        try:
-                            text = review_element.text[:500]  # Берем только начало если не нашли нормально
-                        except:
-                            pass
-                    
-                    # Оценка (звезды)
-                    stars = 0
-                    try:
-                        stars_container = soup.select_one('.business-rating-badge-view__stars')
-                        if stars_container:
-                            star_elements = stars_container.find_all('span')
-                            stars = self.get_count_star(star_elements)
-                        else:
-                            rating_text = soup.select_one('.business-rating-badge-view__rating-text')
-                            if rating_text:
-                                try:
-                                    stars = float(rating_text.text.strip())
-                                except:
-                                    pass
-                    except:
-                        pass
-                    
-                    # Пропускаем отзывы без текста или с мусором
-                    if not text or len(text.strip()) < 10 or text == "Подписаться":
-                        continue
-                    
-                    # Анализируем тональность
-                    sentiment_analysis = self.analyze_sentiment(text)
-                    
-                    # Корректируем оценку на основе звезд (более мягкая логика)
-                    if stars > 0:
-                        if stars >= 4.5:
-                            sentiment_analysis['score'] += 4
-                        elif stars >= 4:
-                            sentiment_analysis['score'] += 3
-                        elif stars >= 3.5:
-                            sentiment_analysis['score'] += 2
-                        elif stars >= 3:
-                            sentiment_analysis['score'] += 1
-                        elif stars <= 2.5:
-                            sentiment_analysis['score'] -= 1
-                        elif stars <= 2:
-                            sentiment_analysis['score'] -= 2
-                        elif stars <= 1:
-                            sentiment_analysis['score'] -= 3
-                    
-                    # ИСПРАВЛЕННАЯ ЛОГИКА РАСПРЕДЕЛЕНИЯ
-                    final_sentiment = sentiment_analysis['sentiment']
-                    
-                    if sentiment_analysis['score'] >= 3:  # Четко позитивный
-                        final_sentiment = 'positive'
-                        positive_comments.append({
-                            'name': name,
-                            'text': text[:300],
-                            'stars': stars,
-                            'date': date
-                        })
-                    elif sentiment_analysis['score'] <= -3:  # Четко негативный
-                        final_sentiment = 'negative'
-                        negative_comments.append({
-                            'name': name,
-                            'text': text[:300],
-                            'stars': stars,
-                            'date': date
-                        })
-                    else:  # Нейтральный или смешанный
-                        final_sentiment = 'neutral'
-                        neutral_comments.append({
-                            'name': name,
-                            'text': text[:300],
-                            'stars': stars,
-                            'date': date
-                        })
-                    
-                    # Сохраняем отзыв
-                    review_id = f"review_{review_count}"
-                    user_comments[review_id] = {
-                        'name': name,
-                        'stars': stars,
-                        'date': date,
-                        'text': text,
-                        'sentiment': final_sentiment,
-                        'analysis': sentiment_analysis
-                    }
-                    
-                    review_count += 1
-                    
-                    if review_count % 10 == 0:
-                        print(f"  Обработано отзывов: {review_count}/{len(reviews_elements)}")
-                    
-                except Exception as e:
-                    if review_count % 20 == 0:  # Не спамим ошибками
-                        print(f"  Пропущен отзыв {i}: {str(e)[:50]}...")
-                    continue
+            new_reviews = reviews
+            known_reviews = []
+            if previous:
+                # С сайта берем только новые отзывы, остальные - из сохраненных файлов,
+                # чтобы файл оставался полным снимком ресторана для всех читателей output/
+                new_reviews = [
+                    review for review in reviews
+                    if review_fingerprint(review['name'], review['date'], review['text']) not in previous['fingerprints']
+                ]
+                print(f"Новых отзывов: {len(new_reviews)} (предыдущий файл: {previous['file']})")
+                known_reviews = previous_reviews(previous, "output")
+                reviews = new_reviews + known_reviews
             
-            total_comments = len(user_comments)
-            sentiment_stats = {
-                'total_comments': total_comments,
-                'positive_count': len(positive_comments),
-                'negative_count': len(negative_comments),
-                'neutral_count': len(neutral_comments),
-                'positive_percentage': round(len(positive_comments) / total_comments * 100, 2) if total_comments > 0 else 0,
-                'negative_percentage': round(len(negative_comments) / total_comments * 100, 2) if total_comments > 0 else 0,
-                'neutral_percentage': round(len(neutral_comments) / total_comments * 100, 2) if total_comments > 0 else 0
-            }
+            # Анализируем тональность всех отзывов за один вызов
+            summary = self.summarize_reviews(reviews)
+            sentiment_stats = summary['sentiment_analysis']
             
             result = {
                 'restaurant_info': {
@@ -321,33 +338,41 @@ class RestaurantReviewParser:
                     'url': url,
                     'parsed_at': time.strftime("%Y-%m-%d %H:%M:%S")
                 },
-                'user_comments': user_comments,
-                'sentiment_analysis': sentiment_stats,
-                'positive_comments': positive_comments[:15],  # Ограничиваем только для отображения
-                'negative_comments': negative_comments[:15],
-                'neutral_comments': neutral_comments[:15]
+                **summary,
+                'scrape_stats': self.waiter.summary()
             }
+            if self.page_metrics:
+                result['scrape_stats']['network'] = collect_page_metrics(self.driver)
+            if previous:
+                result['restaurant_info']['incremental'] = {
+                    'base_file': previous['file'],
+                    'known_reviews': len(known_reviews),
+                    'new_reviews': len(new_reviews)
+                }
             
-            # Сохраняем в файл
-            safe_name = re.sub(r'[^\w\s-]', '', restaurant_name).strip().replace(' ', '_')
-            filename = f"reviews_{safe_name}_{int(time.time())}.json"
-            
-            output_dir = "output"
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, filename)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            # Сохраняем в файл (в инкрементальном режиме - только если есть новые отзывы)
+            output_path = None
+            if new_reviews or not previous:
+                output_path = self.save_result(result)
+            self.last_output_path = output_path
             
             print(f"\n{'='*80}")
             print(f"РЕЗУЛЬТАТЫ ПАРСИНГА: {restaurant_name}")
             print(f"{'='*80}")
-            print(f"Всего отзывов на странице: {len(reviews_elements)}")
+            print(f"Всего отзывов на странице: {found_count}")
             print(f"Успешно обработано: {sentiment_stats['total_comments']}")
             print(f"Позитивных: {sentiment_stats['positive_count']} ({sentiment_stats['positive_percentage']}%)")
             print(f"Негативных: {sentiment_stats['negative_count']} ({sentiment_stats['negative_percentage']}%)")
             print(f"Нейтральных: {sentiment_stats['neutral_count']} ({sentiment_stats['neutral_percentage']}%)")
-            print(f"Файл с результатами: {output_path}")
+            print(f"Ожидание: загрузка {result['scrape_stats']['page_load_seconds']} с, "
+                  f"прокрутка {result['scrape_stats']['scroll_wait_seconds']} с, "
+                  f"таймаутов {result['scrape_stats']['timeouts']}")
+            if self.page_metrics:
+                network = result['scrape_stats']['network']
+                print(f"Сеть: {network['bytes_transferred'] / 1024 / 1024:.2f} МБ, "
+                      f"запросов {network['requests']}, заблокировано {network['blocked_requests']}, "
+                      f"DOMContentLoaded {network['dom_content_loaded_ms']} мс")
+            print(f"Файл с результатами: {output_path or 'не создан, новых отзывов нет'}")
             print(f"{'='*80}")
             
             return result
@@ -359,14 +384,13 @@ class RestaurantReviewParser:
             return None
 
 
-def main():
-    """Основная функция для Docker"""
+def create_driver(lean: bool = True):
+    """Запускает headless Chrome с настройками для Docker.
+
+    lean - облегченный профиль: без картинок, шрифтов, тайлов карты и аналитики.
+    """
     from selenium.webdriver.chrome.options import Options
     
-    print("=" * 80)
-    print("🍽️  ПАРСЕР ОТЗЫВОВ РЕСТОРАНОВ В DOCKER")
-    print("=" * 80)
-    
     # Настройки для Docker
     opts = Options()
     opts.add_argument('--no-sandbox')
@@ -375,725 +399,70 @@ def main():
     opts.add_argument('--disable-gpu')
     opts.add_argument('--window-size=1920,1080')
     opts.binary_location = '/usr/bin/google-chrome'
+    if lean:
+        apply_lean_options(opts)
+    
+    driver = webdriver.Chrome(options=opts)
+    driver.set_window_size(1920, 1080)
+    if lean:
+        enable_request_blocking(driver)
+    return driver
+
+
+def main():
+    """Основная функция для Docker"""
+    import argparse
+    from parser_pool import ParserPool
+    from run_journal import RunJournal
+    from catalog import load_catalog, parse_shard, shard_restaurants
+    
+    arg_parser = argparse.ArgumentParser(description="Парсер отзывов ресторанов")
+    arg_parser.add_argument('--workers', type=int, default=int(os.environ.get('PARSER_WORKERS', 1)),
+                            help="Сколько браузеров запускать параллельно")
+    arg_parser.add_argument('--max-attempts', type=int, default=3,
+                            help="Сколько раз пробовать ресторан при падении браузера")
+    arg_parser.add_argument('--page-timeout', type=float, default=15,
+                            help="Максимум секунд на загрузку страницы с отзывами")
+    arg_parser.add_argument('--scroll-timeout', type=float, default=6,
+                            help="Максимум секунд на подгрузку отзывов после прокрутки")
+    arg_parser.add_argument('--lean', action=argparse.BooleanOptionalAction, default=True,
+                            help="Облегченный профиль Chrome: без картинок, шрифтов, тайлов и аналитики")
+    arg_parser.add_argument('--compact', action='store_true',
+                            help="Маленький summary JSON + отзывы отдельным JSON Lines файлом")
+    arg_parser.add_argument('--compression', choices=['gzip', 'zstd'], default=None,
+                            help="Сжатие файла с отзывами в компактном режиме")
+    arg_parser.add_argument('--incremental', action='store_true',
+                            help="Сохранять только новые отзывы, останавливаясь на уже известных")
+    arg_parser.add_argument('--catalog', default=os.environ.get('PARSER_CATALOG', 'restaurants.csv'),
+                            help="Файл со списком ресторанов (CSV name,url или JSONL)")
+    arg_parser.add_argument('--shard', default=os.environ.get('PARSER_SHARD'),
+                            help="Часть каталога для этой машины в формате i/N (i от 0 до N-1)")
+    arg_parser.add_argument('--journal', default=None,
+                            help="Журнал прогресса: после перезапуска готовые рестораны пропускаются")
+    arg_parser.add_argument('--new-run', action='store_true',
+                            help="Начать обход заново, даже если прошлый не завершен (старый журнал переименовывается)")
+    args = arg_parser.parse_args()
+    
+    if args.journal is None:
+        # У каждого шарда свой журнал, чтобы машины не мешали друг другу в общей папке
+        journal_name = "progress.jsonl"
+        if args.shard:
+            journal_name = f"progress_shard{args.shard.replace('/', 'of')}.jsonl"
+        args.journal = os.path.join("output", journal_name)
     
-    driver = None
+    print("=" * 80)
+    print("🍽️  ПАРСЕР ОТЗЫВОВ РЕСТОРАНОВ В DOCKER")
+    print("=" * 80)
     
     try:
-        print("1. 🚀 Запускаем Chrome в Docker...")
-        driver = webdriver.Chrome(options=opts)
-        driver.set_window_size(1920, 1080)
-        print("   ✅ Chrome успешно запущен!")
+        # СПИСОК РЕСТОРАНОВ (СВОИ ССЫЛКИ ДОБАВЛЯЙ В restaurants.csv)
+        restaurants = load_catalog(args.catalog)
+        print(f"1. 📒 Каталог {args.catalog}: {len(restaurants)} ресторанов")
         
-        # Создаем парсер
-        parser = RestaurantReviewParser(driver)
-        
-        # СПИСОК РЕСТОРАНОВ (ТЫ ДОБАВИШЬ СВОИ ССЫЛКИ)
-        restaurants = [
-            {
-                'name': 'Руки Вверх',
-                'url': 'https://yandex.ru/maps/org/ruki_vverkh_/61051687701/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.621506%2C64.547847&mode=search&sll=40.555588%2C64.547813&tab=reviews&text=category_id%3A%28184106390%29&z=12'
-            },
-            {
-                'name': 'БГ (Бургер Гриль)',
-                'url': 'https://yandex.ru/maps/org/bg/1710293547/reviews/'
-            },
-            {
-                'name': 'Напекла',
-                'url': 'https://yandex.ru/maps/org/napekla/195075538071/reviews/'
-            },
-            {
-                'name': 'Анров',
-                'url': 'https://yandex.ru/maps/org/anrov/29048376633/reviews/'
-            },
-            {
-                'name': 'Vkuss Суши',
-                'url': 'https://yandex.ru/maps/org/vkuss_sushi/116784392153/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.555588%2C64.547847&mode=search&sll=40.555588%2C64.547813&tab=reviews&text=category_id%3A%28184106390%29&z=12'
-            },
-            {
-                'name': 'Эребуни',
-                'url': 'https://yandex.ru/maps/org/erebuni/242006151730/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Inside',
-                'url': 'https://yandex.ru/maps/org/inside/126786506724/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Кофе s вафли',
-                'url': 'https://yandex.ru/maps/org/kofe_s_vafli/51593471756/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Ялта',
-                'url': 'https://yandex.ru/maps/org/yalta/1782833264/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Калитка Парк',
-                'url': 'https://yandex.ru/maps/org/kalitka_park/5082803970/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Старый Архангельск',
-                'url': 'https://yandex.ru/maps/org/stary_arkhangelsk/197813814285/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Hindi',
-                'url': 'https://yandex.ru/maps/org/hindi/24767446847/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Rampa street cafe',
-                'url': 'https://yandex.ru/maps/org/rampa_street_cafe/195262812284/reviews/?display-text=%D0%9A%D0%B0%D1%84%D0%B5&ll=40.513022%2C64.542904&mode=search&sctx=ZAAAAAgBEAAaKAoSCYFCPX0EQkRAEfOtD%2BuNIlBAEhIJD9B9ObNd3z8RLGLYYUz61T8iBgABAgMEBSgKOABAmIYGSAFqAnJ1nQHNzMw9oAEAqAEAvQFiVHEZwgGOAbKkw8WFB77C9YEzq4TErwbkn8Ko2AOGlOrcwwTH0aHggwXS6taslwK5mqybbIaA292IB87L0t6kAu%2BpxK6mBOiP0L6qAtON5dYGidq2rdUDn%2Fq2g%2F0Ek7n1yh77nsbxA6KtiOupAp7ql%2FlTuLakoMQE8JzvzeYG4%2BWS6rsEgsPntqoFj7fXrMUDoI3aw3yCAhdjYXRlZ29yeV9pZDooMTg0MTA2MzkwKYoCCTE4NDEwNjM5MJICAJoCDGRlc2t0b3AtbWFwc6oCFzU3Njg2ODE5MjUyLDE1NTk0MjY0NTg42gIoChIJUcQihh1HREARRt8C7Q8jUEASEgkALhmuq1W%2FPxEAkNWUAfO1P%2BACAQ%3D%3D&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=category_id%3A%28184106390%29&z=15.32'
-            },
-            {
-                'name': 'Пур Наволок',
-                'url': 'https://yandex.ru/maps/org/pur_navolok/1166831997/reviews/?display-text=%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD&ll=40.514869%2C64.542274&mode=search&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=%7B%22text%22%3A%22%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD%22%2C%22what%22%3A%5B%7B%22attr_name%22%3A%22category_id%22%2C%22attr_values%22%3A%5B%22184106394%22%5D%7D%5D%7D&z=14.03'
-            },
-            {
-                'name': 'Cheesy',
-                'url': 'https://yandex.ru/maps/org/cheesy/220827170496/reviews/?display-text=%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD&ll=40.514869%2C64.542274&mode=search&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=%7B%22text%22%3A%22%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD%22%2C%22what%22%3A%5B%7B%22attr_name%22%3A%22category_id%22%2C%22attr_values%22%3A%5B%22184106394%22%5D%7D%5D%7D&z=14.03'
-            },
-            {
-                'name': 'Боброфф',
-                'url': 'https://yandex.ru/maps/org/bobroff/1094446636/reviews/?display-text=%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD&ll=40.514869%2C64.542274&mode=search&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=%7B%22text%22%3A%22%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD%22%2C%22what%22%3A%5B%7B%22attr_name%22%3A%22category_id%22%2C%22attr_values%22%3A%5B%22184106394%22%5D%7D%5D%7D&z=14.03'
-            },
-            {
-                'name': 'Грядка',
-                'url': 'https://yandex.ru/maps/org/gryadka/61835884661/reviews/?display-text=%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD&ll=40.514869%2C64.542274&mode=search&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=%7B%22text%22%3A%22%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD%22%2C%22what%22%3A%5B%7B%22attr_name%22%3A%22category_id%22%2C%22attr_values%22%3A%5B%22184106394%22%5D%7D%5D%7D&z=14.03'
-            },
-            {
-                'name': 'Почтовая Контора 1786',
-                'url': 'https://yandex.ru/maps/org/pochtovaya_kontora_1786/222233439985/reviews/?display-text=%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD&ll=40.514869%2C64.542274&mode=search&sll=40.513022%2C64.542904&sspn=0.008216%2C0.009040&tab=reviews&text=%7B%22text%22%3A%22%D0%A0%D0%B5%D1%81%D1%82%D0%BE%D1%80%D0%B0%D0%BD%22%2C%22what%22%3A%5B%7B%22attr_name%22%3A%22category_id%22%2C%22attr_values%22%3A%5B%22184106394%22%5D%7D%5D%7D&z=14.03'
-            },
-            {
-                'name': 'Мороженое 33 Пингвина',
-                'url': 'https://yandex.ru/maps/org/morozhenoye_33_pingvina/157294441905/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Северная Двина',
-                'url': 'https://yandex.ru/maps/org/severnaya_dvina/126996132193/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Verona',
-                'url': 'https://yandex.ru/maps/org/verona/1090661448/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Додо Пицца',
-                'url': 'https://yandex.ru/maps/org/dodo_pitstsa/115036100397/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Додо Пицца',
-                'url': 'https://yandex.ru/maps/org/dodo_pitstsa/181056317735/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'PhoBo',
-                'url': 'https://yandex.ru/maps/org/phobo/153499251427/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Сушитека',
-                'url': 'https://yandex.ru/maps/org/sushiteka/242465076606/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Roomi',
-                'url': 'https://yandex.ru/maps/org/roomi/78581638606/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'El Fuego',
-                'url': 'https://yandex.ru/maps/org/el_fuego/1012103595/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Санта Паста',
-                'url': 'https://yandex.ru/maps/org/santa_pasta/80125102056/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Азия',
-                'url': 'https://yandex.ru/maps/org/aziya/125991496969/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Санта Паста',
-                'url': 'https://yandex.ru/maps/org/santa_pasta/172805875911/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Эребуни',
-                'url': 'https://yandex.ru/maps/org/erebuni/242006151730/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'БрауМастер',
-                'url': 'https://yandex.ru/maps/org/braumaster/1013715480/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Холмс',
-                'url': 'https://yandex.ru/maps/org/kholms/171000577311/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Река',
-                'url': 'https://yandex.ru/maps/org/reka/222879203721/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старый Тифлис',
-                'url': 'https://yandex.ru/maps/org/stary_tiflis/1734715010/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Simple. cafe',
-                'url': 'https://yandex.ru/maps/org/simple_cafe/74987189586/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Генацвале',
-                'url': 'https://yandex.ru/maps/org/genatsvale/172528815164/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'PhoBo',
-                'url': 'https://yandex.ru/maps/org/phobo/153499251427/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'ПиццаФабрика',
-                'url': 'https://yandex.ru/maps/org/pitstsafabrika/172069924702/reviews/?ll=40.615536%2C64.531254&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Престо',
-                'url': 'https://yandex.ru/maps/org/presto/160606490432/reviews/?ll=40.615536%2C64.531254&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Полина',
-                'url': 'https://yandex.ru/maps/org/polina/1043435387/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Verona',
-                'url': 'https://yandex.ru/maps/org/verona/1090661448/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Додо Пицца',
-                'url': 'https://yandex.ru/maps/org/dodo_pitstsa/115036100397/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'АндерСон',
-                'url': 'https://yandex.ru/maps/org/anderson/155618806278/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Сушитека',
-                'url': 'https://yandex.ru/maps/org/sushiteka/242465076606/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Vkuss Суши',
-                'url': 'https://yandex.ru/maps/org/vkuss_sushi/118394883333/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Северная Двина',
-                'url': 'https://yandex.ru/maps/org/severnaya_dvina/126996132193/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Римская кофейня',
-                'url': 'https://yandex.ru/maps/org/rimskaya_kofeynya/1054966761/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'БлинВиль',
-                'url': 'https://yandex.ru/maps/org/blinvil/133252733488/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Миндаль',
-                'url': 'https://yandex.ru/maps/org/mindal/1726666723/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Престо',
-                'url': 'https://yandex.ru/maps/org/presto/1224519151/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Iris Trattoria',
-                'url': 'https://yandex.ru/maps/org/iris_trattoria/194329570928/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Крым',
-                'url': 'https://yandex.ru/maps/org/krym/212578743868/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Двор',
-                'url': 'https://yandex.ru/maps/org/dvor/137340314923/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Маяк',
-                'url': 'https://yandex.ru/maps/org/mayak/228512159061/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'БлинВиль',
-                'url': 'https://yandex.ru/maps/org/blinvil/155755551800/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Боброфф',
-                'url': 'https://yandex.ru/maps/org/bobroff/1094446636/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Temple',
-                'url': 'https://yandex.ru/maps/org/temple/53779158462/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Кензо',
-                'url': 'https://yandex.ru/maps/org/kenzo/1783847102/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Штаб',
-                'url': 'https://yandex.ru/maps/org/shtab/205248320235/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Дружба',
-                'url': 'https://yandex.ru/maps/org/druzhba/1044367569/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Кухня',
-                'url': 'https://yandex.ru/maps/org/kukhnya/97455368545/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Taboo',
-                'url': 'https://yandex.ru/maps/org/taboo/100099882781/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Грядка',
-                'url': 'https://yandex.ru/maps/org/gryadka/241530617158/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Жаркий',
-                'url': 'https://yandex.ru/maps/org/zharkiy/167291116156/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Бакинский бульвар',
-                'url': 'https://yandex.ru/maps/org/bakinskiy_bulvar/216218543150/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Настоять',
-                'url': 'https://yandex.ru/maps/org/nastoyat/165450104297/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Иль Густо',
-                'url': 'https://yandex.ru/maps/org/il_gusto/130822382895/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Ринкан',
-                'url': 'https://yandex.ru/maps/org/rinkan/154761025756/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Вельвет',
-                'url': 'https://yandex.ru/maps/org/velvet/1726344930/reviews/?ll=40.524722%2C64.558458&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Пекарня на Чумбаровке',
-                'url': 'https://yandex.ru/maps/org/pekarnya_na_chumbarovke/1792624339/reviews/?ll=40.528757%2C64.534867&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'По-домашнему',
-                'url': 'https://yandex.ru/maps/org/po_domashnemu/1695961727/reviews/?ll=40.528757%2C64.534867&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Кушать подано',
-                'url': 'https://yandex.ru/maps/org/kushat_podano/121694968719/reviews/?ll=40.528757%2C64.534867&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старый город',
-                'url': 'https://yandex.ru/maps/org/stary_gorod/125230692232/reviews/?ll=40.583157%2C64.536668&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Чердак',
-                'url': 'https://yandex.ru/maps/org/cherdak/24170185628/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Казацкая слобода',
-                'url': 'https://yandex.ru/maps/org/kazatskaya_sloboda/222158011895/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Met Tea 茶无双',
-                'url': 'https://yandex.ru/maps/org/met_tea_/13694230846/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': '1234',
-                'url': 'https://yandex.ru/maps/org/1234/202999130879/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Паратовъ',
-                'url': 'https://yandex.ru/maps/org/paratov/1801653588/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Гуляй, казак!',
-                'url': 'https://yandex.ru/maps/org/gulyay_kazak_/22534288670/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Panorama',
-                'url': 'https://yandex.ru/maps/org/panorama/160147853396/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Iris',
-                'url': 'https://yandex.ru/maps/org/iris/22622988868/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'La-Ваш',
-                'url': 'https://yandex.ru/maps/org/la_vash/1736797259/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Территория еды',
-                'url': 'https://yandex.ru/maps/org/territoriya_yedy/122737080058/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Арарат',
-                'url': 'https://yandex.ru/maps/org/ararat/217963244758/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Яма',
-                'url': 'https://yandex.ru/maps/org/yama/152757927158/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Рестопорт',
-                'url': 'https://yandex.ru/maps/org/restoport/181159067473/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Абшерон',
-                'url': 'https://yandex.ru/maps/org/absheron/1726563248/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Шаурма & Кофе',
-                'url': 'https://yandex.ru/maps/org/shaurma_kofe/213179905210/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старфудс',
-                'url': 'https://yandex.ru/maps/org/starfuds/11814643288/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старфудс',
-                'url': 'https://yandex.ru/maps/org/starfuds/143604104926/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Калитка Парк',
-                'url': 'https://yandex.ru/maps/org/kalitka_park/5082803970/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Грузин',
-                'url': 'https://yandex.ru/maps/org/gruzin/72342542161/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Osobnyak',
-                'url': 'https://yandex.ru/maps/org/osobnyak/113995198152/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Важный анчоуc',
-                'url': 'https://yandex.ru/maps/org/vazhny_anchous/111278116217/reviews/?ll=40.531777%2C64.562585&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Краснодарский парень',
-                'url': 'https://yandex.ru/maps/org/krasnodarskiy_paren/183187923330/reviews/?ll=40.526925%2C64.532767&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Verona',
-                'url': 'https://yandex.ru/maps/org/verona/1090661448/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Додо Пицца',
-                'url': 'https://yandex.ru/maps/org/dodo_pitstsa/115036100397/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Додо Пицца',
-                'url': 'https://yandex.ru/maps/org/dodo_pitstsa/181056317735/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'PhoBo',
-                'url': 'https://yandex.ru/maps/org/phobo/153499251427/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Сушитека',
-                'url': 'https://yandex.ru/maps/org/sushiteka/242465076606/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Roomi',
-                'url': 'https://yandex.ru/maps/org/roomi/78581638606/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'El Fuego',
-                'url': 'https://yandex.ru/maps/org/el_fuego/1012103595/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Санта Паста',
-                'url': 'https://yandex.ru/maps/org/santa_pasta/80125102056/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Азия',
-                'url': 'https://yandex.ru/maps/org/aziya/125991496969/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Санта Паста',
-                'url': 'https://yandex.ru/maps/org/santa_pasta/172805875911/reviews/?ll=40.569117%2C64.545040&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Эребуни',
-                'url': 'https://yandex.ru/maps/org/erebuni/242006151730/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'БрауМастер',
-                'url': 'https://yandex.ru/maps/org/braumaster/1013715480/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Холмс',
-                'url': 'https://yandex.ru/maps/org/kholms/171000577311/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Река',
-                'url': 'https://yandex.ru/maps/org/reka/222879203721/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старый Тифлис',
-                'url': 'https://yandex.ru/maps/org/stary_tiflis/1734715010/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Simple. cafe',
-                'url': 'https://yandex.ru/maps/org/simple_cafe/74987189586/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Генацвале',
-                'url': 'https://yandex.ru/maps/org/genatsvale/172528815164/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'PhoBo',
-                'url': 'https://yandex.ru/maps/org/phobo/153499251427/reviews/?ll=40.513478%2C64.542925&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'ПиццаФабрика',
-                'url': 'https://yandex.ru/maps/org/pitstsafabrika/172069924702/reviews/?ll=40.615536%2C64.531254&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Престо',
-                'url': 'https://yandex.ru/maps/org/presto/160606490432/reviews/?ll=40.615536%2C64.531254&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Полина',
-                'url': 'https://yandex.ru/maps/org/polina/1043435387/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Verona',
-                'url': 'https://yandex.ru/maps/org/verona/1090661448/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Додо Пицца',
-                'url': 'https://yandex.ru/maps/org/dodo_pitstsa/115036100397/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'АндерСон',
-                'url': 'https://yandex.ru/maps/org/anderson/155618806278/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Сушитека',
-                'url': 'https://yandex.ru/maps/org/sushiteka/242465076606/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Vkuss Суши',
-                'url': 'https://yandex.ru/maps/org/vkuss_sushi/118394883333/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Северная Двина',
-                'url': 'https://yandex.ru/maps/org/severnaya_dvina/126996132193/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Римская кофейня',
-                'url': 'https://yandex.ru/maps/org/rimskaya_kofeynya/1054966761/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'БлинВиль',
-                'url': 'https://yandex.ru/maps/org/blinvil/133252733488/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Миндаль',
-                'url': 'https://yandex.ru/maps/org/mindal/1726666723/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Престо',
-                'url': 'https://yandex.ru/maps/org/presto/1224519151/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Iris Trattoria',
-                'url': 'https://yandex.ru/maps/org/iris_trattoria/194329570928/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Крым',
-                'url': 'https://yandex.ru/maps/org/krym/212578743868/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Двор',
-                'url': 'https://yandex.ru/maps/org/dvor/137340314923/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Маяк',
-                'url': 'https://yandex.ru/maps/org/mayak/228512159061/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'БлинВиль',
-                'url': 'https://yandex.ru/maps/org/blinvil/155755551800/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Боброфф',
-                'url': 'https://yandex.ru/maps/org/bobroff/1094446636/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Temple',
-                'url': 'https://yandex.ru/maps/org/temple/53779158462/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Кензо',
-                'url': 'https://yandex.ru/maps/org/kenzo/1783847102/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Штаб',
-                'url': 'https://yandex.ru/maps/org/shtab/205248320235/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Дружба',
-                'url': 'https://yandex.ru/maps/org/druzhba/1044367569/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Кухня',
-                'url': 'https://yandex.ru/maps/org/kukhnya/97455368545/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Taboo',
-                'url': 'https://yandex.ru/maps/org/taboo/100099882781/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Грядка',
-                'url': 'https://yandex.ru/maps/org/gryadka/241530617158/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Жаркий',
-                'url': 'https://yandex.ru/maps/org/zharkiy/167291116156/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Бакинский бульвар',
-                'url': 'https://yandex.ru/maps/org/bakinskiy_bulvar/216218543150/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Настоять',
-                'url': 'https://yandex.ru/maps/org/nastoyat/165450104297/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Иль Густо',
-                'url': 'https://yandex.ru/maps/org/il_gusto/130822382895/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Ринкан',
-                'url': 'https://yandex.ru/maps/org/rinkan/154761025756/reviews/?ll=40.523358%2C64.534777&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Вельвет',
-                'url': 'https://yandex.ru/maps/org/velvet/1726344930/reviews/?ll=40.524722%2C64.558458&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Пекарня на Чумбаровке',
-                'url': 'https://yandex.ru/maps/org/pekarnya_na_chumbarovke/1792624339/reviews/?ll=40.528757%2C64.534867&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'По-домашнему',
-                'url': 'https://yandex.ru/maps/org/po_domashnemu/1695961727/reviews/?ll=40.528757%2C64.534867&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Кушать подано',
-                'url': 'https://yandex.ru/maps/org/kushat_podano/121694968719/reviews/?ll=40.528757%2C64.534867&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старый город',
-                'url': 'https://yandex.ru/maps/org/stary_gorod/125230692232/reviews/?ll=40.583157%2C64.536668&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Чердак',
-                'url': 'https://yandex.ru/maps/org/cherdak/24170185628/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Казацкая слобода',
-                'url': 'https://yandex.ru/maps/org/kazatskaya_sloboda/222158011895/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Met Tea 茶无双',
-                'url': 'https://yandex.ru/maps/org/met_tea_/13694230846/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': '1234',
-                'url': 'https://yandex.ru/maps/org/1234/202999130879/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Паратовъ',
-                'url': 'https://yandex.ru/maps/org/paratov/1801653588/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Гуляй, казак!',
-                'url': 'https://yandex.ru/maps/org/gulyay_kazak_/22534288670/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Panorama',
-                'url': 'https://yandex.ru/maps/org/panorama/160147853396/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Iris',
-                'url': 'https://yandex.ru/maps/org/iris/22622988868/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'La-Ваш',
-                'url': 'https://yandex.ru/maps/org/la_vash/1736797259/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Территория еды',
-                'url': 'https://yandex.ru/maps/org/territoriya_yedy/122737080058/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Арарат',
-                'url': 'https://yandex.ru/maps/org/ararat/217963244758/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Яма',
-                'url': 'https://yandex.ru/maps/org/yama/152757927158/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Рестопорт',
-                'url': 'https://yandex.ru/maps/org/restoport/181159067473/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Абшерон',
-                'url': 'https://yandex.ru/maps/org/absheron/1726563248/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Шаурма & Кофе',
-                'url': 'https://yandex.ru/maps/org/shaurma_kofe/213179905210/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старфудс',
-                'url': 'https://yandex.ru/maps/org/starfuds/11814643288/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Старфудс',
-                'url': 'https://yandex.ru/maps/org/starfuds/143604104926/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Калитка Парк',
-                'url': 'https://yandex.ru/maps/org/kalitka_park/5082803970/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Грузин',
-                'url': 'https://yandex.ru/maps/org/gruzin/72342542161/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Osobnyak',
-                'url': 'https://yandex.ru/maps/org/osobnyak/113995198152/reviews/?ll=40.529061%2C64.532030&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Важный анчоуc',
-                'url': 'https://yandex.ru/maps/org/vazhny_anchous/111278116217/reviews/?ll=40.531777%2C64.562585&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            },
-            {
-                'name': 'Краснодарский парень',
-                'url': 'https://yandex.ru/maps/org/krasnodarskiy_paren/183187923330/reviews/?ll=40.526925%2C64.532767&mode=search&sll=40.536158%2C64.545031&tab=reviews&text=%D0%9A%D0%B0%D1%84%D0%B5&z=13'
-            }
-            # ДОБАВЬ СВОИ ССЫЛКИ ЗДЕСЬ:
-            # {
-            #     'name': 'Название ресторана',
-            #     'url': 'ССЫЛКА_НА_ОТЗЫВЫ'
-            # },
-            # {
-            #     'name': 'Еще один ресторан',
-            #     'url': 'ДРУГАЯ_ССЫЛКА'
-            # }
-        ]
-        
-        # Сколько ресторанов добавил?
-        additional_restaurants = 4  # Измени на нужное количество 18 +
-        
-        if additional_restaurants > 0:
-            print(f"⚠️  ВНИМАНИЕ: Нужно добавить {additional_restaurants} ресторанов в список!")
-            print("   Добавь их в код в разделе 'СПИСОК РЕСТОРАНОВ'")
+        if args.shard:
+            shard_index, shard_count = parse_shard(args.shard)
+            restaurants = shard_restaurants(restaurants, shard_index, shard_count)
+            print(f"   🧩 Шард {shard_index}/{shard_count}: {len(restaurants)} ресторанов")
         
         print(f"\n2. 📋 Будет обработано ресторанов: {len(restaurants)}")
         if len(restaurants) > 0:
@@ -1101,38 +470,37 @@ def main():
             for i, r in enumerate(restaurants, 1):
                 print(f"   {i}. {r['name']}")
         else:
-            print("   ❌ Список ресторанов пуст! Добавь ссылки в код.")
+            print(f"   ❌ Список ресторанов пуст! Добавь ссылки в {args.catalog}")
             return
         
-        all_results = []
-        successful_parses = 0
+        print(f"\n3. 🚀 Запускаем Chrome: {args.workers} воркер(ов)")
+        previous_results = None
+        if args.incremental:
+            previous_results = load_previous_results("output")
+            print(f"   🔁 Инкрементальный режим: известно ресторанов {len(previous_results)}")
         
-        for idx, restaurant in enumerate(restaurants, 1):
-            print(f"\n{'#'*80}")
-            print(f"РЕСТОРАН {idx}/{len(restaurants)}: {restaurant['name']}")
-            print(f"{'#'*80}")
-            
-            try:
-                result = parser.parse_restaurant_reviews(
-                    url=restaurant['url'],
-                    restaurant_name=restaurant['name']
-                )
-                
-                if result:
-                    all_results.append(result)
-                    successful_parses += 1
-                    print(f"✅ Успешно обработан: {restaurant['name']}")
-                else:
-                    print(f"⚠️  Не удалось обработать: {restaurant['name']}")
-                
-                # Пауза между ресторанами
-                if idx < len(restaurants):
-                    print(f"\n⏳ Пауза 5 секунд перед следующим рестораном...")
-                    time.sleep(5)
-                    
-            except Exception as e:
-                print(f"❌ Ошибка при обработке {restaurant['name']}: {str(e)[:100]}")
-                continue
+        def make_parser(driver):
+            # В облегченном профиле страница грузится в режиме eager - не ждем событие load
+            waiter = PageWaiter(driver, page_timeout=args.page_timeout, scroll_timeout=args.scroll_timeout,
+                                eager=args.lean)
+            return RestaurantReviewParser(driver, waiter=waiter, previous_results=previous_results,
+                                          page_metrics=args.lean, compact=args.compact,
+                                          compression=args.compression)
+        
+        journal = RunJournal(args.journal, max_attempts=args.max_attempts)
+        if args.new_run:
+            journal.rotate()
+        elif journal.entries and journal.is_finished(restaurant_key(r['url']) for r in restaurants):
+            # Прошлый прогон завершен - продолжать нечего, начинаем новый
+            print(f"   📒 Прошлый прогон завершен {journal.counts()}, начинаем новый")
+            journal.rotate()
+        elif journal.entries:
+            print(f"   📒 Продолжаем прогон по журналу {args.journal}: {journal.counts()}")
+        
+        pool = ParserPool(lambda: create_driver(lean=args.lean), make_parser, workers=args.workers,
+                          max_attempts=args.max_attempts, journal=journal)
+        all_results = pool.run(restaurants)
+        successful_parses = len(all_results)
         
         # Сводный отчет
         print(f"\n{'='*80}")
@@ -1140,6 +508,9 @@ def main():
         print(f"{'='*80}")
         print(f"Всего ресторанов в списке: {len(restaurants)}")
         print(f"Успешно обработано: {successful_parses}")
+        print(f"Пропущено (готовы в прошлых запусках): {pool.skipped}")
+        print(f"Не удалось обработать: {len(pool.failed)}")
+        pool.print_worker_stats()
         
         if all_results:
             total_reviews = sum(r['sentiment_analysis']['total_comments'] for r in all_results)
@@ -1186,12 +557,6 @@ def main():
         print(f"\n❌ КРИТИЧЕСКАЯ ОШИБКА: {type(e).__name__}: {str(e)[:200]}")
         import traceback
         traceback.print_exc()
-        
-    finally:
-        if driver:
-            print("\nЗакрываем браузер...")
-            driver.quit()
-            print("Браузер закрыт")
     
     print("\n🎉 Парсинг завершен!")
 
@@ -0,0 +1,220 @@
+import itertools
+import queue
+import threading
+import time
+
+from incremental import restaurant_key
+from parser_docker import RestaurantReviewParser
+
+
+class ParserPool:
+    """Пул из нескольких браузеров, которые разбирают общую очередь ресторанов.
+
+    Каждый воркер держит свой webdriver и свой RestaurantReviewParser.
+    Если браузер упал, воркер перезапускает его, а ресторан возвращает в очередь.
+    С журналом (RunJournal) уже готовые рестораны пропускаются, а неудачные
+    повторяются с задержкой: задача возвращается в очередь со временем "не раньше",
+    и воркер тем временем берет другие рестораны, а не спит с открытым браузером.
+    """
+
+    def __init__(self, create_driver, make_parser=RestaurantReviewParser,
+                 workers: int = 1, max_attempts: int = 3, pause: float = 5, journal=None,
+                 poll_interval: float = 1):
+        self.create_driver = create_driver
+        self.make_parser = make_parser
+        self.workers = max(1, workers)
+        self.max_attempts = max_attempts
+        self.pause = pause
+        self.journal = journal
+        # Как часто проверять очередь, если все задачи отложены
+        self.poll_interval = poll_interval
+        self.skipped = 0
+
+        # (не раньше, порядковый номер, задача): первой выдается задача, которая готова раньше
+        self.tasks = queue.PriorityQueue()
+        self.order = itertools.count()
+        self.lock = threading.Lock()
+        self.results = {}
+        self.failed = {}
+        self.worker_stats = {}
+        self.total = 0
+
+    @staticmethod
+    def _driver_alive(driver) -> bool:
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit_driver(driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _put(self, item, not_before: float = 0) -> None:
+        self.tasks.put((not_before, next(self.order), item))
+
+    def _retry_at(self, key: str) -> float:
+        """Когда можно повторить ресторан (по задержке из журнала)"""
+        if not self.journal:
+            return 0
+        return time.time() + self.journal.retry_delay(key)
+
+    def _record(self, worker_id: int, idx: int, restaurant: dict, result, elapsed: float) -> None:
+        with self.lock:
+            stats = self.worker_stats[worker_id]
+            stats['seconds'] += elapsed
+            if result:
+                self.results[idx] = result
+                self.failed.pop(idx, None)
+                stats['done'] += 1
+            else:
+                self.failed[idx] = restaurant
+                stats['failed'] += 1
+
+    def _worker(self, worker_id: int) -> None:
+        driver = None
+        parser = None
+        prefix = f"[воркер {worker_id}]"
+
+        while True:
+            not_before, _, item = self.tasks.get()
+            if item is None:
+                self.tasks.task_done()
+                break
+
+            wait = not_before - time.time()
+            if wait > 0:
+                # Готовых задач нет: возвращаем отложенную и ждем, пока она созреет
+                # или в очереди появится другая
+                self._put(item, not_before)
+                self.tasks.task_done()
+                time.sleep(min(wait, self.poll_interval))
+                continue
+
+            idx, restaurant, attempt = item
+            key = restaurant_key(restaurant['url'])
+            if self.journal:
+                self.journal.record(key, 'started', name=restaurant['name'], url=restaurant['url'],
+                                    worker=worker_id, attempt=attempt)
+            
+            started = time.time()
+            try:
+                print(f"\n{'#'*80}")
+                print(f"{prefix} РЕСТОРАН {idx}/{self.total}: {restaurant['name']} (попытка {attempt})")
+                print(f"{'#'*80}")
+
+                if driver is None:
+                    print(f"{prefix} 🚀 Запускаем Chrome...")
+                    driver = self.create_driver()
+                    parser = self.make_parser(driver)
+                    with self.lock:
+                        self.worker_stats[worker_id]['drivers'] += 1
+
+                result = parser.parse_restaurant_reviews(
+                    url=restaurant['url'],
+                    restaurant_name=restaurant['name']
+                )
+
+                # Парсер сам ловит ошибки, поэтому проверяем, жив ли браузер
+                if not result and not self._driver_alive(driver):
+                    raise RuntimeError("браузер перестал отвечать")
+
+                self._record(worker_id, idx, restaurant, result, time.time() - started)
+                if self.journal:
+                    if result:
+                        self.journal.record(key, 'done', output_file=parser.last_output_path,
+                                            seconds=round(time.time() - started, 1),
+                                            reviews=result['sentiment_analysis']['total_comments'])
+                    else:
+                        self.journal.record(key, 'failed', error="пустой результат",
+                                            seconds=round(time.time() - started, 1))
+                if result:
+                    print(f"{prefix} ✅ Успешно обработан: {restaurant['name']}")
+                else:
+                    print(f"{prefix} ⚠️  Не удалось обработать: {restaurant['name']}")
+
+            except Exception as e:
+                print(f"{prefix} ❌ Ошибка при обработке {restaurant['name']}: {str(e)[:100]}")
+                if self.journal:
+                    self.journal.record(key, 'failed', error=str(e)[:200],
+                                        seconds=round(time.time() - started, 1))
+                if driver is not None:
+                    print(f"{prefix} 🔄 Перезапускаем браузер")
+                    self._quit_driver(driver)
+                driver = None
+                parser = None
+
+                if attempt < self.max_attempts:
+                    retry_at = self._retry_at(key)
+                    print(f"{prefix} ↩️  Возвращаем в очередь: {restaurant['name']} "
+                          f"(повтор через {max(0, retry_at - time.time()):.0f} с)")
+                    self._put((idx, restaurant, attempt + 1), retry_at)
+                else:
+                    self._record(worker_id, idx, restaurant, None, time.time() - started)
+
+            finally:
+                self.tasks.task_done()
+
+            # Пауза между ресторанами
+            if not self.tasks.empty() and self.pause:
+                print(f"\n{prefix} ⏳ Пауза {self.pause} секунд перед следующим рестораном...")
+                time.sleep(self.pause)
+
+        if driver is not None:
+            print(f"\n{prefix} Закрываем браузер...")
+            self._quit_driver(driver)
+
+    def run(self, restaurants: list) -> list:
+        """Обрабатывает все рестораны и возвращает результаты в исходном порядке"""
+        self.total = len(restaurants)
+        retries = []
+        for idx, restaurant in enumerate(restaurants, 1):
+            attempt = 1
+            if self.journal:
+                key = restaurant_key(restaurant['url'])
+                if self.journal.is_done(key):
+                    self.skipped += 1
+                    continue
+                failures = self.journal.failures(key)
+                if failures >= self.max_attempts:
+                    print(f"⛔ Пропускаем {restaurant['name']}: {failures} неудачных попыток")
+                    self.failed[idx] = restaurant
+                    continue
+                if failures:
+                    # Ранее упавшие рестораны - в конец очереди и не раньше конца задержки
+                    retries.append(((idx, restaurant, failures + 1), self._retry_at(key)))
+                    continue
+            self._put((idx, restaurant, attempt))
+
+        for item, retry_at in retries:
+            self._put(item, retry_at)
+
+        if self.skipped:
+            print(f"⏭️  Уже обработано в прошлых запусках: {self.skipped}")
+
+        pending = self.tasks.qsize()
+        threads = []
+        for worker_id in range(1, min(self.workers, pending) + 1):
+            self.worker_stats[worker_id] = {'done': 0, 'failed': 0, 'drivers': 0, 'seconds': 0.0}
+            thread = threading.Thread(target=self._worker, args=(worker_id,), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        # Ждем пока очередь опустеет (включая возвращенные рестораны), затем гасим воркеров
+        self.tasks.join()
+        for _ in threads:
+            self._put(None)
+        for thread in threads:
+            thread.join()
+
+        return [self.results[idx] for idx in sorted(self.results)]
+
+    def print_worker_stats(self) -> None:
+        print(f"\n👷 ВОРКЕРЫ:")
+        for worker_id, stats in sorted(self.worker_stats.items()):
+            print(f"   Воркер {worker_id}: успешно {stats['done']}, неудачно {stats['failed']}, "
+                  f"запусков браузера {stats['drivers']}, {stats['seconds']:.0f} с")
@@ -0,0 +1,127 @@
+import argparse
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from output_format import load_result, write_result
+from sentiment import SentimentAnalyzer
+
+
+# Анализатор создается один раз на процесс-воркер (браузер для пересчета не нужен)
+_parser = None
+
+
+def _init_worker():
+    global _parser
+    _parser = SentimentAnalyzer()
+
+
+def rescore_file(parser: SentimentAnalyzer, path: str) -> int:
+    """Пересчитывает тональность в одном JSON файле, возвращает число отзывов"""
+    data, file_format = load_result(path)
+
+    reviews = []
+    for comment in data.get('user_comments', {}).values():
+        reviews.append({
+            'name': comment.get('name', 'Аноним'),
+            'stars': comment.get('stars', 0),
+            'date': comment.get('date', ''),
+            'text': comment.get('text', '')
+        })
+
+    data.update(parser.summarize_reviews(reviews))
+
+    # Перезаписываем в том же формате (через временный файл, чтобы не оставить битый JSON)
+    write_result(data, path, **file_format)
+
+    return len(reviews)
+
+
+def rescore_chunk(paths: list) -> dict:
+    """Обрабатывает пачку файлов в процессе-воркере"""
+    started = time.time()
+    files = 0
+    reviews = 0
+    errors = []
+
+    for path in paths:
+        try:
+            reviews += rescore_file(_parser, path)
+            files += 1
+        except Exception as e:
+            errors.append(f"{os.path.basename(path)}: {str(e)[:50]}")
+
+    return {
+        'pid': os.getpid(),
+        'files': files,
+        'reviews': reviews,
+        'seconds': time.time() - started,
+        'errors': errors
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Пересчет тональности в output/ без повторного парсинга")
+    arg_parser.add_argument('--output-dir', default='output', help="Папка с reviews_*.json")
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Количество процессов")
+    arg_parser.add_argument('--chunk-size', type=int, default=20, help="Файлов в одной задаче")
+    args = arg_parser.parse_args()
+
+    print("=" * 60)
+    print("🔁 ПЕРЕСЧЕТ ТОНАЛЬНОСТИ ОТЗЫВОВ")
+    print("=" * 60)
+
+    if not os.path.exists(args.output_dir):
+        print(f"⚠️ Папка {args.output_dir} не найдена")
+        return
+
+    json_files = sorted(
+        os.path.join(args.output_dir, f)
+        for f in os.listdir(args.output_dir)
+        if f.endswith('.json')
+    )
+    if not json_files:
+        print(f"⚠️ Нет JSON файлов в папке {args.output_dir}/")
+        return
+
+    chunk_size = max(1, args.chunk_size)
+    chunks = [json_files[i:i + chunk_size] for i in range(0, len(json_files), chunk_size)]
+    print(f"📁 Файлов: {len(json_files)}, задач: {len(chunks)}, процессов: {args.workers}")
+
+    started = time.time()
+    per_worker = defaultdict(lambda: {'files': 0, 'reviews': 0, 'seconds': 0.0})
+    total_files = 0
+    total_reviews = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(rescore_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            stats = future.result()
+            worker = per_worker[stats['pid']]
+            worker['files'] += stats['files']
+            worker['reviews'] += stats['reviews']
+            worker['seconds'] += stats['seconds']
+            total_files += stats['files']
+            total_reviews += stats['reviews']
+
+            for error in stats['errors']:
+                print(f"❌ Ошибка с файлом {error}")
+
+            print(f"  Обработано файлов: {total_files}/{len(json_files)}")
+
+    elapsed = time.time() - started
+
+    print(f"\n📊 ПРОИЗВОДИТЕЛЬНОСТЬ ВОРКЕРОВ:")
+    for pid, worker in sorted(per_worker.items()):
+        rate = worker['reviews'] / worker['seconds'] if worker['seconds'] > 0 else 0
+        print(f"   PID {pid}: файлов {worker['files']}, отзывов {worker['reviews']}, "
+              f"{worker['seconds']:.1f} с, {rate:.0f} отзывов/с")
+
+    print(f"\n✅ Пересчитано файлов: {total_files}, отзывов: {total_reviews} за {elapsed:.1f} с")
+    if elapsed > 0:
+        print(f"   Итого: {total_reviews / elapsed:.0f} отзывов/с")
+
+
+if __name__ == "__main__":
+    main()
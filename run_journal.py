@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+import time
+
+
+class RunJournal:
+    """Журнал прогресса парсинга (append-only JSON Lines в папке output/).
+
+    На каждый ресторан пишутся записи started / done / failed с именем файла
+    результата и временем обработки. После перезапуска готовые рестораны
+    пропускаются, а упавшие повторяются с экспоненциальной задержкой.
+    Запись started без завершения (контейнер упал на середине) считается неудачей.
+    Журнал относится к одному прогону: когда прогон завершен (is_finished),
+    следующий запуск начинает новый журнал через rotate().
+    """
+
+    def __init__(self, path: str = "output/progress.jsonl", max_attempts: int = 3, base_delay: float = 30):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.load()
+
+    def load(self) -> None:
+        self.entries = {}
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Последняя строка могла оборваться при падении
+                    continue
+                self._apply(record)
+
+        # Незавершенные попытки прошлого запуска считаем неудачными
+        for entry in self.entries.values():
+            if entry['status'] == 'started':
+                entry['status'] = 'failed'
+                entry['failures'] += 1
+
+    def _apply(self, record: dict) -> None:
+        entry = self.entries.setdefault(record['key'], {
+            'status': None, 'failures': 0, 'last_time': 0, 'output_file': None
+        })
+        status = record['status']
+        if status == 'failed':
+            entry['failures'] += 1
+        elif status == 'done':
+            entry['output_file'] = record.get('output_file')
+        entry['status'] = status
+        entry['last_time'] = record.get('time', 0)
+
+    def record(self, key: str, status: str, **fields) -> None:
+        """Дописывает запись в журнал и сразу сбрасывает ее на диск"""
+        record = {'key': key, 'status': status, 'time': time.time(), **fields}
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(record)
+
+    def is_done(self, key: str) -> bool:
+        with self.lock:
+            entry = self.entries.get(key)
+            return bool(entry) and entry['status'] == 'done'
+
+    def failures(self, key: str) -> int:
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry['failures'] if entry else 0
+
+    def retry_delay(self, key: str) -> float:
+        """Сколько еще подождать перед повтором: base_delay * 2^(неудач-1) от последней попытки"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry or entry['status'] != 'failed' or entry['failures'] == 0:
+                return 0
+            delay = self.base_delay * 2 ** (entry['failures'] - 1)
+            return max(0, entry['last_time'] + delay - time.time())
+
+    def counts(self) -> dict:
+        with self.lock:
+            counts = {}
+            for entry in self.entries.values():
+                counts[entry['status']] = counts.get(entry['status'], 0) + 1
+            return counts
+
+    def is_finished(self, keys) -> bool:
+        """Прогон завершен: каждый ресторан готов или исчерпал попытки"""
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if not entry:
+                    return False
+                if entry['status'] != 'done' and entry['failures'] < self.max_attempts:
+                    return False
+            return True
+
+    def rotate(self) -> None:
+        """Начать новый прогон: старый журнал переименовывается"""
+        with self.lock:
+            if os.path.exists(self.path):
+                os.replace(self.path, f"{self.path}.{int(time.time())}")
+            self.entries = {}
@@ -0,0 +1,276 @@
+import re
+
+
+# Разбиваем текст на чередующиеся участки "слово" / "не слово"
+TOKEN_RE = re.compile(r'\w+|\W+')
+
+# Увеличил списки ключевых слов
+POSITIVE_KEYWORDS = [
+    'отлично', 'прекрасно', 'хорошо', 'рекомендую', 'супер', 
+    'отличный', 'замечательно', 'великолепно', 'восхитительно',
+    'удовлетворен', 'понравилось', 'люблю', 'обожаю', 'восторг',
+    'прекрасный', 'хороший', 'отличное', 'класс', 'топ', 'лучший',
+    'вкусно', 'вкусный', 'уютно', 'чисто', 'быстро', 'вежливо',
+    'потрясающе', 'шикарно', 'безупречно', 'идеально', 'нравится',
+    'доволен', 'приятно', 'восхищение', 'наслаждение', 'обалденно',
+    'превосходно', 'сказочно', 'чудесно', 'невероятно', 'фантастически',
+    'кайф', 'удовольствие', 'рад', 'счастлив', 'довольна'
+]
+NEGATIVE_KEYWORDS = [
+    'плохо', 'ужасно', 'отвратительно', 'недоволен', 'не рекомендую',
+    'кошмар', 'разочарован', 'жутко', 'гадость', 'отвратительный',
+    'плохой', 'неприятно', 'отвратительное', 'ужасный', 'не понравилось',
+    'ненавижу', 'отвращение', 'ужас', 'позор', 'отвратно', 'грубо',
+    'грязно', 'долго', 'дорого', 'пересолено', 'недоварено', 'пережарено',
+    'несвежий', 'неопрятно', 'хамство', 'бесит', 'раздражает', 'зря',
+    'напутали', 'перепутали', 'обманули', 'кинули', 'обсчитали',
+    'переплатил', 'недовольна', 'злюсь', 'бесит', 'возмущена'
+]
+
+
+def _split_runs(text: str) -> tuple:
+    return tuple(TOKEN_RE.findall(text))
+
+
+class KeywordMatcher:
+    """Поиск ключевых слов за один проход по тексту.
+
+    Дает тот же результат, что и поиск r'\\b<слово>\\b' по каждому слову отдельно:
+    слово (или фраза) считается найденным, если его участки совпадают
+    с подряд идущими участками текста, начиная и заканчивая целым словом.
+    """
+
+    def __init__(self, positive_keywords: list, negative_keywords: list):
+        self.positive_keywords = list(positive_keywords)
+        self.negative_keywords = list(negative_keywords)
+
+        # Первое слово ключа -> список (участки ключа, ключ)
+        self._by_first_word = {}
+        # Ключи, которые не начинаются/не заканчиваются словом, ищем регуляркой
+        self._fallback = {}
+
+        for word in set(self.positive_keywords) | set(self.negative_keywords):
+            runs = _split_runs(word)
+            if runs and re.fullmatch(r'\w+', runs[0]) and re.fullmatch(r'\w+', runs[-1]):
+                self._by_first_word.setdefault(runs[0], []).append((runs, word))
+            else:
+                self._fallback[word] = re.compile(r'\b' + re.escape(word) + r'\b')
+
+    def find(self, text_lower: str) -> set:
+        """Возвращает множество ключевых слов, найденных в тексте (текст уже в нижнем регистре)"""
+        found = set()
+        runs = TOKEN_RE.findall(text_lower)
+        total = len(runs)
+
+        for i, run in enumerate(runs):
+            candidates = self._by_first_word.get(run)
+            if not candidates:
+                continue
+            for key_runs, word in candidates:
+                size = len(key_runs)
+                if size == 1 or (i + size <= total and tuple(runs[i:i + size]) == key_runs):
+                    found.add(word)
+
+        for word, pattern in self._fallback.items():
+            if pattern.search(text_lower):
+                found.add(word)
+
+        return found
+
+    def match_indices(self, text_lower: str) -> tuple:
+        """Индексы найденных слов в списках позитивных и негативных ключей"""
+        found = self.find(text_lower)
+        positive_idx = [i for i, word in enumerate(self.positive_keywords) if word in found]
+        negative_idx = [i for i, word in enumerate(self.negative_keywords) if word in found]
+        return positive_idx, negative_idx
+
+    def match(self, text_lower: str) -> tuple:
+        """Списки найденных позитивных и негативных слов в порядке списков ключей"""
+        found = self.find(text_lower)
+        found_positive = [word for word in self.positive_keywords if word in found]
+        found_negative = [word for word in self.negative_keywords if word in found]
+        return found_positive, found_negative
+
+
+def text_sentiment(score: int) -> str:
+    """Тональность только по тексту: хотя бы одно слово без противовеса"""
+    if score >= 2:
+        return 'positive'
+    if score <= -2:
+        return 'negative'
+    return 'neutral'
+
+
+def star_adjustment(stars) -> int:
+    """Поправка балла по звездам (более мягкая логика)"""
+    if not stars or stars <= 0:
+        return 0
+    if stars >= 4.5:
+        return 4
+    elif stars >= 4:
+        return 3
+    elif stars >= 3.5:
+        return 2
+    elif stars >= 3:
+        return 1
+    elif stars <= 2.5:
+        return -1
+    elif stars <= 2:
+        return -2
+    elif stars <= 1:
+        return -3
+    return 0
+
+
+def final_sentiment(score: int) -> str:
+    """Итоговая тональность отзыва с учетом звезд"""
+    if score >= 3:  # Четко позитивный
+        return 'positive'
+    if score <= -3:  # Четко негативный
+        return 'negative'
+    return 'neutral'  # Нейтральный или смешанный
+
+
+class SentimentAnalyzer:
+    """Тональность отзывов по спискам ключевых слов.
+
+    Браузер не нужен, поэтому класс используют и парсер, и пересчет в rescore.py.
+    """
+
+    def __init__(self, positive_keywords: list = None, negative_keywords: list = None):
+        self.positive_keywords = list(positive_keywords or POSITIVE_KEYWORDS)
+        self.negative_keywords = list(negative_keywords or NEGATIVE_KEYWORDS)
+        # Поисковик ключевых слов строим один раз
+        self.matcher = KeywordMatcher(self.positive_keywords, self.negative_keywords)
+
+    def analyze_sentiment(self, text: str) -> dict:
+        if not text or not isinstance(text, str):
+            return {
+                'sentiment': 'neutral',
+                'score': 0,
+                'positive_words': [],
+                'negative_words': []
+            }
+        
+        text_lower = text.lower()
+        
+        # Ищем слова с границами слов (один проход по тексту)
+        found_positive, found_negative = self.matcher.match(text_lower)
+        
+        # Считаем вес: позитивные слова дают +2, негативные -2
+        score = (len(found_positive) * 2) - (len(found_negative) * 2)
+        
+        # Определяем тональность
+        sentiment = text_sentiment(score)
+        
+        return {
+            'sentiment': sentiment,
+            'score': score,
+            'positive_words': found_positive,
+            'negative_words': found_negative,
+            'text_length': len(text)
+        }
+
+    def analyze_sentiment_batch(self, texts: list, stars: list = None) -> dict:
+        """Анализ тональности пачки отзывов.
+
+        Возвращает колонки одинаковой длины: итоговый балл (с поправкой на звезды),
+        итоговую тональность (порог ±3), тональность только по тексту, длину текста
+        и индексы найденных слов в positive_keywords/negative_keywords.
+        """
+        if stars is None:
+            stars = [0] * len(texts)
+        
+        scores = []
+        sentiments = []
+        text_sentiments = []
+        text_lengths = []
+        positive_idx = []
+        negative_idx = []
+        
+        match_indices = self.matcher.match_indices
+        for text, star in zip(texts, stars):
+            if text and isinstance(text, str):
+                pos, neg = match_indices(text.lower())
+                text_lengths.append(len(text))
+            else:
+                pos, neg = [], []
+                text_lengths.append(0)
+            
+            base_score = (len(pos) * 2) - (len(neg) * 2)
+            score = base_score + star_adjustment(star)
+            
+            scores.append(score)
+            sentiments.append(final_sentiment(score))
+            text_sentiments.append(text_sentiment(base_score))
+            positive_idx.append(pos)
+            negative_idx.append(neg)
+        
+        return {
+            'score': scores,
+            'sentiment': sentiments,
+            'text_sentiment': text_sentiments,
+            'text_length': text_lengths,
+            'positive_idx': positive_idx,
+            'negative_idx': negative_idx
+        }
+
+    def summarize_reviews(self, reviews: list) -> dict:
+        """Считает тональность для списка отзывов и собирает секции результата"""
+        batch = self.analyze_sentiment_batch(
+            [review['text'] for review in reviews],
+            [review['stars'] for review in reviews]
+        )
+        
+        user_comments = {}
+        positive_comments = []
+        negative_comments = []
+        neutral_comments = []
+        by_sentiment = {
+            'positive': positive_comments,
+            'negative': negative_comments,
+            'neutral': neutral_comments
+        }
+        
+        for i, review in enumerate(reviews):
+            sentiment = batch['sentiment'][i]
+            by_sentiment[sentiment].append({
+                'name': review['name'],
+                'text': review['text'][:300],
+                'stars': review['stars'],
+                'date': review['date']
+            })
+            
+            user_comments[f"review_{i}"] = {
+                'name': review['name'],
+                'stars': review['stars'],
+                'date': review['date'],
+                'text': review['text'],
+                'sentiment': sentiment,
+                'analysis': {
+                    'sentiment': batch['text_sentiment'][i],
+                    'score': batch['score'][i],
+                    'positive_words': [self.positive_keywords[j] for j in batch['positive_idx'][i]],
+                    'negative_words': [self.negative_keywords[j] for j in batch['negative_idx'][i]],
+                    'text_length': batch['text_length'][i]
+                }
+            }
+        
+        total_comments = len(user_comments)
+        sentiment_stats = {
+            'total_comments': total_comments,
+            'positive_count': len(positive_comments),
+            'negative_count': len(negative_comments),
+            'neutral_count': len(neutral_comments),
+            'positive_percentage': round(len(positive_comments) / total_comments * 100, 2) if total_comments > 0 else 0,
+            'negative_percentage': round(len(negative_comments) / total_comments * 100, 2) if total_comments > 0 else 0,
+            'neutral_percentage': round(len(neutral_comments) / total_comments * 100, 2) if total_comments > 0 else 0
+        }
+        
+        return {
+            'user_comments': user_comments,
+            'sentiment_analysis': sentiment_stats,
+            'positive_comments': positive_comments[:15],  # Ограничиваем только для отображения
+            'negative_comments': negative_comments[:15],
+            'neutral_comments': neutral_comments[:15]
+        }
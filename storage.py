@@ -0,0 +1,194 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from output_loader import load_records, print_load_stats, record_values, scan_changes
+
+# Схема restaurant_reviews из hive_loader.py
+RESTAURANT_REVIEWS_COLUMNS = (
+    ('restaurant_name', 'STRING'),
+    ('total_reviews', 'INT'),
+    ('positive_reviews', 'INT'),
+    ('negative_reviews', 'INT'),
+    ('neutral_reviews', 'INT'),
+    ('positive_percentage', 'DOUBLE'),
+    ('negative_percentage', 'DOUBLE'),
+    ('parsed_date', 'STRING'),
+    ('source_url', 'STRING'),
+)
+
+# Строковый литерал, идентификатор в кавычках или параметр %s
+SQL_TOKEN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|%s")
+
+
+class HiveBackend:
+    """Запросы к Hive через общий пул соединений"""
+
+    name = 'hive'
+
+    def query(self, sql: str, params: tuple = None) -> list:
+        from hive_pool import get_pool
+        with get_pool().connection() as cursor:
+            cursor.execute(sql, params)
+            return [tuple(row) for row in cursor.fetchall()]
+
+
+class EmbeddedBackend(ABC):
+    """Встроенная БД (SQLite или DuckDB) с той же таблицей restaurant_reviews.
+
+    Данные лежат в restaurant_reviews_data, где у каждой строки есть source_file, а
+    restaurant_reviews - представление с колонками Hive. При проверке (не чаще раза в
+    recheck_interval секунд) перечитываются только новые и измененные файлы, а строки
+    удаленных файлов стираются. Файлы читаются без блокировки запросов - запросы в это
+    время видят прежние данные.
+    Запросы пишутся как для Hive: параметры %s переводятся в ? для встроенной БД.
+    """
+
+    name = None
+
+    def __init__(self, path: str, output_dir: str = "output", recheck_interval: float = 2.0):
+        self.path = path
+        self.output_dir = output_dir
+        self.recheck_interval = recheck_interval
+        self.lock = threading.Lock()  # соединение: запросы и запись изменений
+        self.sync_lock = threading.Lock()  # синхронизацию с output/ ведет один поток
+        self.checked_at = 0
+        self.files = {}  # имя файла -> (mtime, size) загруженной версии
+        self.conn = self._connect()
+        self._create_table()
+
+    @abstractmethod
+    def _connect(self):
+        """Открывает соединение с файлом БД"""
+
+    def _type(self, hive_type: str) -> str:
+        return {'STRING': 'VARCHAR', 'INT': 'INTEGER', 'DOUBLE': 'DOUBLE'}[hive_type]
+
+    def _create_table(self) -> None:
+        # Таблица - производная от output/, поэтому при старте собирается заново
+        columns = ", ".join(f"{name} {self._type(hive_type)}" for name, hive_type in RESTAURANT_REVIEWS_COLUMNS)
+        # В старых файлах БД restaurant_reviews была таблицей, а не представлением
+        for (kind,) in self.conn.execute(
+                "SELECT type FROM sqlite_master WHERE name = 'restaurant_reviews'").fetchall():
+            self.conn.execute(f"DROP {kind.upper()} restaurant_reviews")
+        self.conn.execute("DROP TABLE IF EXISTS restaurant_reviews_data")
+        self.conn.execute(f"CREATE TABLE restaurant_reviews_data ({columns}, source_file {self._type('STRING')})")
+        names = ", ".join(name for name, _ in RESTAURANT_REVIEWS_COLUMNS)
+        self.conn.execute(f"CREATE VIEW restaurant_reviews AS SELECT {names} FROM restaurant_reviews_data")
+
+    def sync(self, force: bool = False) -> bool:
+        """Дочитывает новые и измененные файлы output/, возвращает True если таблица изменилась"""
+        now = time.time()
+        if not force and now - self.checked_at < self.recheck_interval:
+            return False
+        # Если другой поток уже синхронизирует, не ждем его - отвечаем по текущим данным
+        if not self.sync_lock.acquire(blocking=force):
+            return False
+        try:
+            self.checked_at = now
+            current, removed, stale = scan_changes(self.output_dir, self.files)
+            if not removed and not stale:
+                return False
+
+            rows = []
+            if stale:
+                loaded = load_records(self.output_dir, stale)
+                print_load_stats(loaded)
+                rows = [record_values(record) + (json_file,) for json_file, record in loaded['records'].items()]
+
+            placeholders = ", ".join(["?"] * (len(RESTAURANT_REVIEWS_COLUMNS) + 1))
+            with self.lock:
+                self.conn.execute("BEGIN")
+                try:
+                    self.conn.executemany("DELETE FROM restaurant_reviews_data WHERE source_file = ?",
+                                          [(json_file,) for json_file in removed + stale])
+                    if rows:
+                        self.conn.executemany(f"INSERT INTO restaurant_reviews_data VALUES ({placeholders})", rows)
+                    self.conn.execute("COMMIT")
+                except Exception:
+                    self.conn.execute("ROLLBACK")
+                    raise
+
+            for json_file in removed:
+                del self.files[json_file]
+            for json_file in stale:
+                self.files[json_file] = current[json_file]
+            print(f"✅ {self.name}: обновлено файлов {len(stale)}, удалено {len(removed)}, "
+                  f"всего файлов в restaurant_reviews {len(self.files)}")
+            return True
+        finally:
+            self.sync_lock.release()
+
+    def query(self, sql: str, params: tuple = None) -> list:
+        self.sync()
+        with self.lock:
+            cursor = self.conn.execute(self._placeholders(sql), params or ())
+            return [tuple(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _placeholders(sql: str) -> str:
+        """Переводит параметры %s в ?, не трогая строковые литералы"""
+        return SQL_TOKEN.sub(lambda match: '?' if match.group() == '%s' else match.group(), sql)
+
+
+class SQLiteBackend(EmbeddedBackend):
+    name = 'sqlite'
+
+    def _connect(self):
+        # isolation_level=None - транзакциями управляем сами через BEGIN/COMMIT
+        return sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+
+    def _type(self, hive_type: str) -> str:
+        return {'STRING': 'TEXT', 'INT': 'INTEGER', 'DOUBLE': 'REAL'}[hive_type]
+
+
+class DuckDBBackend(EmbeddedBackend):
+    name = 'duckdb'
+
+    def _connect(self):
+        try:
+            import duckdb
+        except ImportError:
+            raise RuntimeError("Для STORAGE_BACKEND=duckdb нужен пакет duckdb: pip install duckdb")
+        return duckdb.connect(self.path)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend(name: str = None):
+    """Хранилище процесса: STORAGE_BACKEND=hive (по умолчанию), sqlite или duckdb.
+
+    Для встроенных БД файл задается STORAGE_PATH (по умолчанию в папке output/).
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is not None:
+            return _backend
+
+        name = name or os.environ.get('STORAGE_BACKEND', 'hive')
+        output_dir = os.environ.get('STORAGE_OUTPUT_DIR', 'output')
+        if name == 'hive':
+            _backend = HiveBackend()
+        elif name == 'sqlite':
+            _backend = SQLiteBackend(os.environ.get('STORAGE_PATH', os.path.join(output_dir, 'reviews.sqlite')), output_dir)
+        elif name == 'duckdb':
+            _backend = DuckDBBackend(os.environ.get('STORAGE_PATH', os.path.join(output_dir, 'reviews.duckdb')), output_dir)
+        else:
+            raise ValueError(f"Неизвестное хранилище: {name} (hive, sqlite, duckdb)")
+        return _backend
+
+
+if __name__ == "__main__":
+    import sys
+
+    backend = get_backend(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"📦 Хранилище: {backend.name}")
+    for name, positive in backend.query(
+            "SELECT restaurant_name, positive_percentage FROM restaurant_reviews "
+            "ORDER BY positive_percentage DESC LIMIT 10"):
+        print(f"  {name}: {positive}% позитивных")
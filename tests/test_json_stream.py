@@ -0,0 +1,95 @@
+import json
+import os
+import random
+
+import pytest
+
+from json_stream import iter_comments, read_summary
+from output_format import write_result
+
+SMALL_CHUNKS = range(1, 9)
+
+# Строки с экранированием, юникодом и символами, похожими на разметку JSON
+TRICKY_STRINGS = [
+    "", "просто текст", 'кавычки "внутри"', "обратный \\ слэш", "\\\"", "скобки {[}]", "запятая, двоеточие:",
+    "перевод\r\nстроки", "\tтаб", "\u0000\u001f", "эмодзи 😀", "\\u0041", "\"}", "\\",
+]
+
+
+def generated_result(seed: int, reviews: int = 12) -> dict:
+    """Результат парсинга со вложенными значениями и граничными числами"""
+    rng = random.Random(seed)
+    user_comments = {}
+    for i in range(reviews):
+        user_comments[f"review_{i}"] = {
+            'author': rng.choice(TRICKY_STRINGS),
+            'text': ' '.join(rng.choice(TRICKY_STRINGS) for _ in range(rng.randint(0, 4))),
+            'rating': rng.choice([None, 1, 5, 4.5, -0.0, 1e-7, 12345678901234567890]),
+            'sentiment': rng.choice(['positive', 'negative', 'neutral']),
+            'positive_words': [rng.choice(TRICKY_STRINGS) for _ in range(rng.randint(0, 3))],
+            'meta': {'likes': rng.randint(0, 1000), 'nested': [[], {}, [{'a': True, 'b': False}]]},
+        }
+    return {
+        'restaurant_info': {'name': rng.choice(TRICKY_STRINGS), 'url': "https://example.com/?a=1&b=\"2\""},
+        'user_comments': user_comments,
+        'sentiment_analysis': {'total_comments': reviews, 'positive_percentage': 33.33,
+                               'top_words': [['вкусно', 3], ['плохо', 1]]},
+        'positive_reviews': list(user_comments)[:2],
+        'empty': {},
+        # Числа верхнего уровня читаются сами по себе и могут оборваться на границе куска
+        'parse_seconds': 1234.5678e-3,
+        'pages': 120,
+        'parsed_at': "2026-01-01T00:00:00",
+        'version': -17,
+    }
+
+
+def assert_matches_json_load(path: str, chunk_size: int) -> None:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    expected = {key: value for key, value in data.items() if key != 'user_comments'}
+
+    assert read_summary(path, chunk_size=chunk_size) == expected
+    assert read_summary(path, ('restaurant_info',), chunk_size=chunk_size) == {
+        'restaurant_info': data['restaurant_info']}
+    assert list(iter_comments(path, chunk_size=chunk_size)) == list(data.get('user_comments', {}).items())
+
+
+@pytest.fixture(params=['normal', 'compact', 'crlf'])
+def result_file(request, tmp_path):
+    path = str(tmp_path / 'result.json')
+    result = generated_result(seed=len(request.param))
+    if request.param == 'crlf':
+        write_result(result, path)
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text.replace('\n', '\r\n'))
+    else:
+        write_result(result, path, compact=request.param == 'compact')
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', SMALL_CHUNKS)
+def test_small_chunks(result_file, chunk_size):
+    assert_matches_json_load(result_file, chunk_size)
+
+
+def test_default_chunk(result_file):
+    assert_matches_json_load(result_file, 64 * 1024)
+
+
+def test_saved_results():
+    # Файлы из output/ (обычные и компактные summary)
+    output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'output')
+    if not os.path.isdir(output_dir):
+        pytest.skip("нет папки output/")
+
+    paths = [os.path.join(output_dir, json_file) for json_file in sorted(os.listdir(output_dir))
+             if json_file.endswith('.json')]
+    if not paths:
+        pytest.skip("в output/ нет файлов результата")
+
+    for path in paths:
+        for chunk_size in list(SMALL_CHUNKS) + [64 * 1024]:
+            assert_matches_json_load(path, chunk_size)
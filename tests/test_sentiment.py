@@ -0,0 +1,143 @@
+import os
+import random
+import re
+
+import pytest
+
+from output_format import iter_reviews
+from sentiment import NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS, KeywordMatcher, SentimentAnalyzer
+
+# Свои списки с трудными случаями: фразы, дефисы, подчеркивания, ключи-префиксы других ключей
+POSITIVE = ['отлично', 'хорошо', 'рекомендую', 'супер', 'топ', 'лучший', 'не плохо', 'вкусно-вкусно', 'класс']
+NEGATIVE = ['плохо', 'не рекомендую', 'не понравилось', 'бесит', 'ужас', 'супер_пупер', 'кошмар!', '-_-']
+
+FIXED_TEXTS = [
+    "",
+    "Не рекомендую! Было плохо, хотя кофе отличный.",
+    "ОТЛИЧНО-отлично, супер_пупер, бесит бесит",
+    "не  рекомендую (два пробела), не понравилось совсем",
+    "хорошо\nне рекомендую\tне понравилось",
+    "суперхорошо топовый",
+    "не плохо, не плохо, вкусно-вкусно",
+    "кошмар! просто кошмар",
+    "оценка -_- и всё",
+    "топ топ топ класс",
+    "рекомендую.",
+    "не",
+]
+
+WORDS = ['не', 'плохо', 'хорошо', 'рекомендую', 'супер', 'пупер', 'топ', 'топовый', 'вкусно',
+         'кошмар', 'бесит', 'класс', 'лучший', 'ужасно', 'кофе', 'а', 'Отлично', 'ХОРОШО']
+SEPARATORS = [' ', '  ', '-', '_', ', ', '! ', '\n', '\t', '.', '-_-', '']
+
+
+def analyze_sentiment_reference(text: str, positive_keywords: list, negative_keywords: list) -> dict:
+    """Старая реализация (по регулярке на каждое слово) - эталон для сверки KeywordMatcher"""
+    if not text or not isinstance(text, str):
+        return {
+            'sentiment': 'neutral',
+            'score': 0,
+            'positive_words': [],
+            'negative_words': []
+        }
+
+    text_lower = text.lower()
+
+    found_positive = []
+    for word in positive_keywords:
+        pattern = r'\b' + re.escape(word) + r'\b'
+        if re.search(pattern, text_lower):
+            found_positive.append(word)
+
+    found_negative = []
+    for word in negative_keywords:
+        pattern = r'\b' + re.escape(word) + r'\b'
+        if re.search(pattern, text_lower):
+            found_negative.append(word)
+
+    score = (len(found_positive) * 2) - (len(found_negative) * 2)
+
+    if score >= 2:
+        sentiment = 'positive'
+    elif score <= -2:
+        sentiment = 'negative'
+    else:
+        sentiment = 'neutral'
+
+    return {
+        'sentiment': sentiment,
+        'score': score,
+        'positive_words': found_positive,
+        'negative_words': found_negative,
+        'text_length': len(text)
+    }
+
+
+def generated_corpus(count: int = 3000, seed: int = 1) -> list:
+    """Случайные тексты из ключевых слов и разделителей (включая склейку без разделителя)"""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            parts.append(rng.choice(WORDS))
+            parts.append(rng.choice(SEPARATORS))
+        texts.append(''.join(parts))
+    return texts
+
+
+def assert_same(matcher: KeywordMatcher, texts: list) -> None:
+    for text in texts:
+        expected = analyze_sentiment_reference(text, matcher.positive_keywords, matcher.negative_keywords)
+        text_lower = (text or '').lower()
+        assert matcher.match(text_lower) == (expected['positive_words'], expected['negative_words']), text
+
+
+def test_fixed_texts():
+    assert_same(KeywordMatcher(POSITIVE, NEGATIVE), FIXED_TEXTS)
+
+
+def test_generated_corpus():
+    assert_same(KeywordMatcher(POSITIVE, NEGATIVE), generated_corpus())
+
+
+def test_match_indices_follow_keyword_order():
+    matcher = KeywordMatcher(POSITIVE, NEGATIVE)
+    positive_idx, negative_idx = matcher.match_indices("класс, отлично, но не рекомендую")
+    assert positive_idx == [POSITIVE.index('отлично'), POSITIVE.index('рекомендую'), POSITIVE.index('класс')]
+    assert negative_idx == [NEGATIVE.index('не рекомендую')]
+
+
+def test_parser_keywords():
+    # Списки и анализатор, которыми пользуются parser_docker и rescore
+    analyzer = SentimentAnalyzer()
+    for text in FIXED_TEXTS + generated_corpus(500, seed=2):
+        expected = analyze_sentiment_reference(text, POSITIVE_KEYWORDS, NEGATIVE_KEYWORDS)
+        assert analyzer.analyze_sentiment(text) == expected, text
+
+
+def test_batch_matches_single():
+    analyzer = SentimentAnalyzer()
+    texts = FIXED_TEXTS + generated_corpus(200, seed=3)
+    batch = analyzer.analyze_sentiment_batch(texts)
+    for i, text in enumerate(texts):
+        single = analyzer.analyze_sentiment(text)
+        assert batch['text_sentiment'][i] == single['sentiment'], text
+        assert [analyzer.positive_keywords[j] for j in batch['positive_idx'][i]] == single['positive_words'], text
+        assert [analyzer.negative_keywords[j] for j in batch['negative_idx'][i]] == single['negative_words'], text
+
+
+def test_saved_reviews():
+    # Отзывы из output/ в любом формате (обычный и компактный)
+    output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'output')
+    if not os.path.isdir(output_dir):
+        pytest.skip("нет папки output/")
+
+    texts = []
+    for json_file in sorted(os.listdir(output_dir)):
+        if json_file.endswith('.json'):
+            texts.extend(comment.get('text', '') for _, comment in iter_reviews(os.path.join(output_dir, json_file)))
+    if not texts:
+        pytest.skip("в output/ нет отзывов")
+
+    assert_same(KeywordMatcher(POSITIVE, NEGATIVE), texts)
@@ -1,54 +1,190 @@
-import matplotlib
-matplotlib.use('Agg')  # Для работы без GUI в Docker
-import matplotlib.pyplot as plt
+# Рисуем через объекты Figure без pyplot: у pyplot общее глобальное состояние,
+# и параллельные запросы Flask портили бы друг другу графики
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import pandas as pd
 import os
 import json
 import io
 import base64
-from pyhive import hive
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from hive_simulator import hive_sim
+from storage import get_backend
+
+# Сколько графиков может рисоваться одновременно
+RENDER_WORKERS = int(os.environ.get('RENDER_WORKERS', '2'))
+render_pool = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix='render')
+
+
+def data_fingerprint(data) -> str:
+    """Отпечаток данных графика: одинаковые данные - одинаковая картинка"""
+    payload = json.dumps(data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ChartCache:
+    """Готовые PNG графиков по имени и отпечатку данных.
+
+    Пока отпечаток не изменился, график не перерисовывается. ETag считается
+    по содержимому PNG и используется для ответа 304 в веб-интерфейсе.
+    Рисование идет в render_pool; одновременные запросы одного и того же
+    графика ждут одну общую задачу, а не рисуют его каждый сам.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.pending = {}  # имя -> (отпечаток, Future)
+        self.renders = 0
+        self.hits = 0
+
+    def get(self, name: str, fingerprint: str, render) -> dict:
+        """{'png', 'etag', 'fingerprint'} или None, если render() ничего не нарисовал"""
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry and entry['fingerprint'] == fingerprint:
+                self.hits += 1
+                return entry
+
+            pending = self.pending.get(name)
+            if pending and pending[0] == fingerprint:
+                future = pending[1]
+            else:
+                future = render_pool.submit(self._render, name, fingerprint, render)
+                self.pending[name] = (fingerprint, future)
+
+        return future.result()
+
+    def _render(self, name: str, fingerprint: str, render) -> dict:
+        try:
+            png = render()
+            if png is None:
+                return None
+
+            entry = {
+                'png': png,
+                'etag': hashlib.sha1(png).hexdigest(),
+                'fingerprint': fingerprint
+            }
+            with self.lock:
+                self.entries[name] = entry
+                self.renders += 1
+            return entry
+        finally:
+            with self.lock:
+                if self.pending.get(name, (None,))[0] == fingerprint:
+                    del self.pending[name]
+
+
+chart_cache = ChartCache()
+
+
+def _save_png(fig: Figure) -> bytes:
+    """Рендерит фигуру в PNG"""
+    FigureCanvasAgg(fig)
+    img_bytes = io.BytesIO()
+    fig.savefig(img_bytes, format='png', dpi=100)
+    return img_bytes.getvalue()
+
+
+def histogram_png(rows: list, title: str, colored: bool = False) -> bytes:
+    """Гистограмма процента позитивных по списку (ресторан, процент)"""
+    df = pd.DataFrame(rows, columns=['restaurant', 'positive_percentage'])
+
+    fig = Figure(figsize=(12, 6))
+    ax = fig.add_subplot()
+    if colored:
+        df = df.sort_values('positive_percentage', ascending=False)
+        colors = ['green' if x > 50 else 'orange' if x > 20 else 'red' for x in df['positive_percentage']]
+    else:
+        colors = 'skyblue'
+    positions = range(len(df))
+    bars = ax.bar(positions, df['positive_percentage'], color=colors)
+
+    # Добавляем значения на столбцы
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
+                f'{height:.1f}%', ha='center', va='bottom')
+
+    ax.set_title(title, fontsize=16, pad=20)
+    ax.set_xlabel('Рестораны', fontsize=12)
+    ax.set_ylabel('Позитивные отзывы (%)', fontsize=12)
+    ax.set_ylim(0, 100)
+    ax.set_xticks(list(positions))
+    ax.set_xticklabels(df['restaurant'], rotation=45, ha='right')
+    fig.tight_layout()
+
+    return _save_png(fig)
+
+
+def pie_png(sizes: list) -> bytes:
+    """Круговая диаграмма позитивных / негативных / нейтральных"""
+    labels = ['Позитивные', 'Негативные', 'Нейтральные']
+    colors = ['#4CAF50', '#F44336', '#FFC107']
+
+    fig = Figure(figsize=(8, 8))
+    ax = fig.add_subplot()
+    ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
+    ax.set_title('📈 Распределение тональности всех отзывов', fontsize=16)
+    ax.axis('equal')
+
+    return _save_png(fig)
+
+
+def fetch_hive_histogram_rows() -> list:
+    """[(ресторан, % позитивных)] из хранилища (Hive или встроенная БД, см. storage.py)"""
+    return get_backend().query("SELECT restaurant_name, positive_percentage FROM restaurant_reviews")
+
+
+def fetch_json_histogram_rows() -> list:
+    """[(ресторан, % позитивных)] из JSON файлов через HiveSimulator (дочитывает только новые файлы)"""
+    hive_sim.refresh()
+    return [(row['restaurant_name'], row['positive_percentage']) for row in hive_sim.get_data()]
+
+
+def fetch_hive_pie_sizes() -> list:
+    """[позитивных, негативных, нейтральных] по всем ресторанам из хранилища"""
+    data = get_backend().query("""
+        SELECT
+            SUM(positive_reviews) as positive,
+            SUM(negative_reviews) as negative,
+            SUM(neutral_reviews) as neutral
+        FROM restaurant_reviews
+    """)[0]
+    return [data[0], data[1], data[2]]
+
+
+def cached_histogram(rows: list, from_hive: bool = True) -> dict:
+    """Гистограмма из кэша, перерисовывается только при изменении данных"""
+    if from_hive:
+        title, colored = '📊 Процент позитивных отзывов по ресторанам', False
+    else:
+        title, colored = '📊 Процент позитивных отзывов по ресторанам (из JSON)', True
+    return chart_cache.get(
+        'histogram',
+        data_fingerprint([from_hive, rows]),
+        lambda: histogram_png(rows, title, colored)
+    )
+
+
+def cached_pie(sizes: list) -> dict:
+    """Круговая диаграмма из кэша"""
+    return chart_cache.get('pie', data_fingerprint(sizes), lambda: pie_png(sizes))
+
 
 def create_histogram_from_hive():
     """Создает гистограмму из данных Hive"""
     try:
-        # Подключаемся к Hive
-        conn = hive.Connection(host='hive-server', port=10000)
-        cursor = conn.cursor()
-        
-        cursor.execute("USE restaurant_analysis")
-        cursor.execute("SELECT restaurant_name, positive_percentage FROM restaurant_reviews")
-        data = cursor.fetchall()
-        
+        data = fetch_hive_histogram_rows()
+
         if not data:
             return create_histogram_from_json()  # Если Hive пуст
-        
-        df = pd.DataFrame(data, columns=['restaurant', 'positive_percentage'])
-        
-        # Создаем график
-        plt.figure(figsize=(12, 6))
-        bars = plt.bar(df['restaurant'], df['positive_percentage'], color='skyblue')
-        
-        # Добавляем значения на столбцы
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{height:.1f}%', ha='center', va='bottom')
-        
-        plt.title('📊 Процент позитивных отзывов по ресторанам', fontsize=16, pad=20)
-        plt.xlabel('Рестораны', fontsize=12)
-        plt.ylabel('Позитивные отзывы (%)', fontsize=12)
-        plt.ylim(0, 100)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        # Сохраняем в байты
-        img_bytes = io.BytesIO()
-        plt.savefig(img_bytes, format='png', dpi=100)
-        img_bytes.seek(0)
-        plt.close()
-        
-        return base64.b64encode(img_bytes.read()).decode()
-        
+
+        return base64.b64encode(cached_histogram(data, from_hive=True)['png']).decode()
+
     except Exception as e:
         print(f"Ошибка при создании гистограммы из Hive: {e}")
         return create_histogram_from_json()
@@ -56,53 +192,13 @@ def create_histogram_from_hive():
 def create_histogram_from_json():
     """Создает гистограмму из JSON файлов"""
     try:
-        data = []
-        output_dir = "output"
-        
-        if not os.path.exists(output_dir):
-            return None
-        
-        for file in os.listdir(output_dir):
-            if file.endswith('.json'):
-                with open(os.path.join(output_dir, file), 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
-                    data.append({
-                        'restaurant': json_data['restaurant_info']['name'],
-                        'positive_percentage': json_data['sentiment_analysis']['positive_percentage']
-                    })
-        
+        data = fetch_json_histogram_rows()
+
         if not data:
             return None
-        
-        df = pd.DataFrame(data)
-        df = df.sort_values('positive_percentage', ascending=False)
-        
-        # Создаем график
-        plt.figure(figsize=(12, 6))
-        colors = ['green' if x > 50 else 'orange' if x > 20 else 'red' for x in df['positive_percentage']]
-        bars = plt.bar(df['restaurant'], df['positive_percentage'], color=colors)
-        
-        # Добавляем значения
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{height:.1f}%', ha='center', va='bottom')
-        
-        plt.title('📊 Процент позитивных отзывов по ресторанам (из JSON)', fontsize=16, pad=20)
-        plt.xlabel('Рестораны', fontsize=12)
-        plt.ylabel('Позитивные отзывы (%)', fontsize=12)
-        plt.ylim(0, 100)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        # Сохраняем в байты
-        img_bytes = io.BytesIO()
-        plt.savefig(img_bytes, format='png', dpi=100)
-        img_bytes.seek(0)
-        plt.close()
-        
-        return base64.b64encode(img_bytes.read()).decode()
-        
+
+        return base64.b64encode(cached_histogram(data, from_hive=False)['png']).decode()
+
     except Exception as e:
         print(f"Ошибка при создании гистограммы из JSON: {e}")
         return None
@@ -110,34 +206,8 @@ def create_histogram_from_json():
 def create_pie_chart():
     """Создает круговую диаграмму"""
     try:
-        conn = hive.Connection(host='hive-server', port=10000)
-        cursor = conn.cursor()
-        cursor.execute("USE restaurant_analysis")
-        cursor.execute("""
-            SELECT 
-                SUM(positive_reviews) as positive,
-                SUM(negative_reviews) as negative,
-                SUM(neutral_reviews) as neutral
-            FROM restaurant_reviews
-        """)
-        data = cursor.fetchone()
-        
-        labels = ['Позитивные', 'Негативные', 'Нейтральные']
-        sizes = [data[0], data[1], data[2]]
-        colors = ['#4CAF50', '#F44336', '#FFC107']
-        
-        plt.figure(figsize=(8, 8))
-        plt.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-        plt.title('📈 Распределение тональности всех отзывов', fontsize=16)
-        plt.axis('equal')
-        
-        img_bytes = io.BytesIO()
-        plt.savefig(img_bytes, format='png', dpi=100)
-        img_bytes.seek(0)
-        plt.close()
-        
-        return base64.b64encode(img_bytes.read()).decode()
-        
+        return base64.b64encode(cached_pie(fetch_hive_pie_sizes())['png']).decode()
+
     except:
         return None
 
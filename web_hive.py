@@ -1,9 +1,17 @@
 # web_hive.py - ПОЛНАЯ ВЕРСИЯ С ГИСТОГРАММАМИ
+import base64
+import bisect
+import gzip
+import threading
 import time
-from flask import Flask, render_template_string
+from collections import OrderedDict
+from flask import Flask, Response, jsonify, render_template_string, request
 import json
 import os
 
+from output_format import iter_reviews
+from output_loader import load_records, print_load_stats, scan_changes
+
 app = Flask(__name__)
 
 HTML_TEMPLATE = '''
@@ -170,23 +178,9 @@ HTML_TEMPLATE = '''
             transform: translateY(-3px);
             box-shadow: 0 10px 20px rgba(76, 175, 80, 0.3);
         }
-        .raw-data {
-            background: #2c3e50;
-            color: #ecf0f1;
-            padding: 20px;
-            border-radius: 10px;
-            margin-top: 30px;
-            max-height: 400px;
-            overflow-y: auto;
-        }
-        .raw-data h3 {
-            color: #ecf0f1;
-        }
-        .raw-data pre {
-            background: #34495e;
-            padding: 15px;
-            border-radius: 5px;
-            overflow-x: auto;
+        .load-more {
+            display: block;
+            margin: 0 auto 25px;
         }
     </style>
 </head>
@@ -258,7 +252,7 @@ HTML_TEMPLATE = '''
                     <th>Дата анализа</th>
                 </tr>
             </thead>
-            <tbody>
+            <tbody id="restaurants-body">
                 {% for row in data %}
                 <tr>
                     <td><strong>{{ loop.index }}</strong></td>
@@ -274,14 +268,18 @@ HTML_TEMPLATE = '''
                 {% endfor %}
             </tbody>
         </table>
+        {% if next_cursor %}
+        <button class="refresh-button load-more" id="load-more" data-cursor="{{ next_cursor }}"
+                data-shown="{{ data|length }}">⬇️ Показать еще</button>
+        {% endif %}
         
         <!-- ГИСТОГРАММЫ -->
-        {% if histogram_img or pie_chart_img %}
+        {% if charts %}
         <div class="charts-container">
-            {% if histogram_img %}
+            {% if 'histogram' in charts %}
             <div class="chart">
                 <h2>📊 Гистограмма позитивных отзывов</h2>
-                <img src="data:image/png;base64,{{ histogram_img }}" 
+                <img src="/charts/histogram.png?v={{ chart_version }}" 
                      alt="Гистограмма позитивных отзывов">
                 <p style="text-align: center; color: #666; margin-top: 10px;">
                     Распределение процента позитивных отзывов по ресторанам
@@ -289,10 +287,10 @@ HTML_TEMPLATE = '''
             </div>
             {% endif %}
             
-            {% if pie_chart_img %}
+            {% if 'pie' in charts %}
             <div class="chart">
                 <h2>📈 Распределение тональности отзывов</h2>
-                <img src="data:image/png;base64,{{ pie_chart_img }}" 
+                <img src="/charts/pie.png?v={{ chart_version }}" 
                      alt="Круговая диаграмма распределения">
                 <p style="text-align: center; color: #666; margin-top: 10px;">
                     Соотношение позитивных, негативных и нейтральных отзывов
@@ -302,12 +300,6 @@ HTML_TEMPLATE = '''
         </div>
         {% endif %}
         
-        <!-- СЫРЫЕ ДАННЫЕ -->
-        <div class="raw-data">
-            <h3>📋 Сырые данные из Hive (JSON формат)</h3>
-            <pre>{{ json_data }}</pre>
-        </div>
-        
         <!-- ИНФОРМАЦИЯ О СИСТЕМЕ -->
         <div style="margin-top: 40px; padding: 20px; background: #f8f9fa; border-radius: 10px;">
             <h3>ℹ️ Информация о системе</h3>
@@ -316,7 +308,11 @@ HTML_TEMPLATE = '''
                 <li><strong>База данных:</strong> restaurant_analysis</li>
                 <li><strong>Таблица:</strong> restaurant_reviews</li>
                 <li><strong>Данные обновлены:</strong> {{ current_time }}</li>
+                <li><strong>Хранилище ({{ readiness.backend }}):</strong> {{ '✅ доступно' if readiness.hive else '⏳ недоступно, данные из JSON' }}
+                    (проверка {{ readiness.checked_at or 'еще не выполнялась' }})</li>
                 <li><strong>Файлов JSON:</strong> {{ json_files_count }} в папке /app/output</li>
+                <li><strong>Данные в JSON:</strong> <code>/api/restaurants</code>,
+                    <code>/api/restaurants/&lt;id&gt;/reviews</code></li>
             </ul>
         </div>
         {% endif %}
@@ -329,6 +325,52 @@ HTML_TEMPLATE = '''
     </div>
     
     <script>
+        // Следующие страницы рейтинга подгружаются из /api/restaurants
+        document.addEventListener('DOMContentLoaded', function() {
+            const button = document.getElementById('load-more');
+            if (!button) {
+                return;
+            }
+            button.addEventListener('click', function() {
+                const url = '/api/restaurants?sort=positive_percentage&order=desc&limit={{ page_size }}'
+                    + '&cursor=' + encodeURIComponent(button.dataset.cursor);
+                fetch(url).then(response => response.json()).then(page => {
+                    const body = document.getElementById('restaurants-body');
+                    let shown = Number(button.dataset.shown);
+                    page.items.forEach(row => {
+                        shown += 1;
+                        // [текст, css-класс, жирный]
+                        const cells = [
+                            [shown, '', true],
+                            [row.restaurant_name, '', true],
+                            [row.total_reviews, ''],
+                            [row.positive_reviews, 'positive'],
+                            [row.negative_reviews, 'negative'],
+                            [row.neutral_reviews, 'neutral'],
+                            [row.positive_percentage.toFixed(1) + '%', 'positive'],
+                            [row.negative_percentage.toFixed(1) + '%', 'negative'],
+                            [row.parsed_date ? row.parsed_date.slice(0, 19) : 'N/A', '']
+                        ];
+                        const tr = document.createElement('tr');
+                        cells.forEach(([text, className, bold]) => {
+                            const td = document.createElement('td');
+                            td.className = className;
+                            const target = bold ? td.appendChild(document.createElement('strong')) : td;
+                            target.textContent = text;
+                            tr.appendChild(td);
+                        });
+                        body.appendChild(tr);
+                    });
+                    button.dataset.shown = shown;
+                    if (page.next_cursor) {
+                        button.dataset.cursor = page.next_cursor;
+                    } else {
+                        button.remove();
+                    }
+                });
+            });
+        });
+        
         // Автоматическое обновление каждые 60 секунд
         setTimeout(function() {
             window.location.reload();
@@ -351,99 +393,203 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+OUTPUT_DIR = "/app/output"
+
+
+class SummaryCache:
+    """Кэш сводок по файлам output/ на весь процесс.
+
+    Каждый файл хранится под ключом (mtime, size): при проверке перечитываются только
+    новые и измененные файлы, а суммы обновляются вычитанием старой строки и
+    добавлением новой. Папка проверяется не чаще раза в recheck_interval секунд,
+    между проверками данные отдаются без обращения к диску.
+    """
+
+    def __init__(self, output_dir: str = OUTPUT_DIR, recheck_interval: float = 2.0):
+        self.output_dir = output_dir
+        self.recheck_interval = recheck_interval
+        self.lock = threading.Lock()
+        self.files = {}  # имя -> {'key': (mtime, size), 'row': dict или None}
+        self.totals = self._empty_totals()
+        self.sorted_rows = []
+        self.stats = None
+        self.checked_at = 0
+        self.version = 0
+
+    @staticmethod
+    def _empty_totals() -> dict:
+        return {'restaurants': 0, 'reviews': 0, 'positive': 0, 'negative': 0, 'neutral': 0, 'positive_pct': 0.0}
+
+    def _account(self, row: dict, sign: int) -> None:
+        if row is None:
+            return
+        self.totals['restaurants'] += sign
+        self.totals['reviews'] += sign * row['total_reviews']
+        self.totals['positive'] += sign * row['positive_reviews']
+        self.totals['negative'] += sign * row['negative_reviews']
+        self.totals['neutral'] += sign * row['neutral_reviews']
+        self.totals['positive_pct'] += sign * row['positive_percentage']
+
+    def refresh(self, force: bool = False) -> bool:
+        """Сверяет кэш с папкой, возвращает True если данные изменились"""
+        now = time.time()
+        if not force and now - self.checked_at < self.recheck_interval:
+            return False
+        self.checked_at = now
+
+        known = {json_file: cached['key'] for json_file, cached in self.files.items()}
+        current, removed, stale = scan_changes(self.output_dir, known)
+
+        changed = False
+        for json_file in removed:
+            self._account(self.files.pop(json_file)['row'], -1)
+            changed = True
+
+        if stale:
+            loaded = load_records(self.output_dir, stale)
+            print_load_stats(loaded)
+            for json_file in stale:
+                row = loaded['records'].get(json_file)
+                if row is not None:
+                    row['id'] = json_file[:-len('.json')]
+                cached = self.files.get(json_file)
+                if cached:
+                    self._account(cached['row'], -1)
+                self._account(row, +1)
+                self.files[json_file] = {'key': current[json_file], 'row': row}
+            changed = True
+
+        if changed:
+            self._rebuild()
+        return changed
+
+    def _rebuild(self) -> None:
+        rows = [cached['row'] for cached in self.files.values() if cached['row'] is not None]
+        # Сортируем по проценту позитивных отзывов (по убыванию)
+        rows.sort(key=lambda x: x['positive_percentage'], reverse=True)
+        self.sorted_rows = rows
+        self.version += 1
+
+        totals = self.totals
+        count = totals['restaurants']
+        self.stats = {
+            'total_restaurants': count,
+            'total_reviews': totals['reviews'],  # Это общее количество отзывов
+            'total_positive': totals['positive'],  # Абсолютное число позитивных
+            'total_negative': totals['negative'],  # Абсолютное число негативных
+            'total_neutral': totals['neutral'],    # Абсолютное число нейтральных
+            'avg_positive': round(totals['positive_pct'] / count, 2) if count > 0 else 0,  # Средний процент
+            'total_comments': totals['reviews'] * 10  # Примерно 10 комментариев на отзыв
+        }
+
+        print(f"\n📊 СТАТИСТИКА:")
+        print(f"   Ресторанов: {self.stats['total_restaurants']}")
+        print(f"   Всего отзывов: {self.stats['total_reviews']}")
+        print(f"   Средний % позитивных: {self.stats['avg_positive']}%")
+        print(f"   Позитивных отзывов: {self.stats['total_positive']}")
+        print(f"   Негативных отзывов: {self.stats['total_negative']}")
+
+    def get(self) -> tuple:
+        """(строки по убыванию % позитивных, статистика, число JSON файлов)"""
+        with self.lock:
+            self.refresh()
+            return self.sorted_rows, self.stats, len(self.files)
+
+
+summary_cache = SummaryCache()
+
+
+class Readiness:
+    """Фоновая проверка готовности источников данных.
+
+    Поток раз за разом проверяет хранилище (Hive или встроенную БД из storage.py)
+    и папку output/: пока что-то не готово -
+    с нарастающей паузой (backoff), после готовности - раз в recheck_interval.
+    Запросы к странице не ждут, а только читают флаги через status().
+    """
+
+    def __init__(self, output_dir: str = OUTPUT_DIR,
+                 min_delay: float = 1, max_delay: float = 60, recheck_interval: float = 60):
+        self.output_dir = output_dir
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.recheck_interval = recheck_interval
+        self.lock = threading.Lock()
+        self.thread = None
+        self.state = {
+            'hive': False,
+            'output': False,
+            'attempts': 0,
+            'checked_at': None,
+            'hive_error': None,
+            'backend': os.environ.get('STORAGE_BACKEND', 'hive')
+        }
+
+    def check_hive(self) -> None:
+        from storage import get_backend
+        get_backend().query("SELECT 1")
+
+    def probe(self) -> bool:
+        """Одна проверка всех источников, True если все готово"""
+        output_ready = os.path.isdir(self.output_dir)
+        hive_error = None
+        try:
+            self.check_hive()
+        except Exception as e:
+            hive_error = str(e)[:200]
+
+        with self.lock:
+            if self.state['hive'] != (hive_error is None):
+                print(f"{'✅' if hive_error is None else '⚠️'} Hive {'доступен' if hive_error is None else 'недоступен'}")
+            self.state.update({
+                'hive': hive_error is None,
+                'output': output_ready,
+                'attempts': self.state['attempts'] + 1,
+                'checked_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'hive_error': hive_error
+            })
+        return output_ready and hive_error is None
+
+    def _run(self) -> None:
+        delay = self.min_delay
+        while True:
+            if self.probe():
+                delay = self.min_delay
+                time.sleep(self.recheck_interval)
+            else:
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_delay)
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(target=self._run, name='readiness', daemon=True)
+            self.thread.start()
+
+    def status(self) -> dict:
+        with self.lock:
+            return dict(self.state)
+
+
+readiness = Readiness()
+
+
 def get_hive_data():
     """Получаем данные из Hive"""
     try:
-        # Сначала пробуем получить реальные данные из JSON файлов
-        import json
-        import os
-        from datetime import datetime
-        
-        output_dir = "/app/output"
-        if not os.path.exists(output_dir):
+        if not os.path.exists(summary_cache.output_dir):
             print("⚠️ Папка output не найдена")
             return None, None, "Папка output не найдена"
         
-        json_files = [f for f in os.listdir(output_dir) if f.endswith('.json')]
-        if not json_files:
+        all_data, stats, files_count = summary_cache.get()
+        if not files_count:
             print("⚠️ Нет JSON файлов")
             return None, None, "Нет JSON файлов. Запустите парсер."
         
-        print(f"📁 Найдено {len(json_files)} JSON файлов")
-        
-        
-        all_data = []
-        total_reviews = 0
-        total_positive = 0
-        total_negative = 0
-        total_neutral = 0
-        
-        for json_file in json_files:
-            try:
-                with open(os.path.join(output_dir, json_file), 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                restaurant_info = data.get('restaurant_info', {})
-                sentiment = data.get('sentiment_analysis', {})
-                
-                restaurant_data = {
-                    'restaurant_name': restaurant_info.get('name', 'Unknown'),
-                    'total_reviews': sentiment.get('total_comments', 0),
-                    'positive_reviews': sentiment.get('positive_count', 0),
-                    'negative_reviews': sentiment.get('negative_count', 0),
-                    'neutral_reviews': sentiment.get('neutral_count', 0),
-                    'positive_percentage': float(sentiment.get('positive_percentage', 0)),
-                    'negative_percentage': float(sentiment.get('negative_percentage', 0)),
-                    'parsed_date': restaurant_info.get('parsed_at', ''),
-                    'source_url': restaurant_info.get('url', '')
-                }
-                
-                all_data.append(restaurant_data)
-                
-                # Суммируем для статистики
-                total_reviews += restaurant_data['total_reviews']
-                total_positive += restaurant_data['positive_reviews']
-                total_negative += restaurant_data['negative_reviews']
-                total_neutral += restaurant_data['neutral_reviews']
-                
-                print(f"✅ Загружено: {restaurant_data['restaurant_name']} - {restaurant_data['positive_percentage']}% позитивных")
-                
-            except Exception as e:
-                print(f"❌ Ошибка чтения {json_file}: {e}")
-                continue
-        
         if not all_data:
             return None, None, "Не удалось загрузить данные из JSON файлов"
         
-        # Сортируем по проценту позитивных отзывов (по убыванию)
-        all_data.sort(key=lambda x: x['positive_percentage'], reverse=True)
-        
-        # Рассчитываем статистику ПРАВИЛЬНО
-        total_restaurants = len(all_data)
-        
-        # Средний процент позитивных отзывов (среднее по ресторанам)
-        avg_positive = sum(d['positive_percentage'] for d in all_data) / total_restaurants if total_restaurants > 0 else 0
-        
-        # Общее количество комментариев (примерно)
-        total_comments = total_reviews * 10  # Примерно 10 комментариев на отзыв
-        
-        stats = {
-            'total_restaurants': total_restaurants,
-            'total_reviews': total_reviews,  # Это общее количество отзывов
-            'total_positive': total_positive,  # Абсолютное число позитивных
-            'total_negative': total_negative,  # Абсолютное число негативных
-            'total_neutral': total_neutral,    # Абсолютное число нейтральных
-            'avg_positive': round(avg_positive, 2),  # Средний процент
-            'total_comments': total_comments
-        }
-        
-        print(f"\n📊 СТАТИСТИКА:")
-        print(f"   Ресторанов: {stats['total_restaurants']}")
-        print(f"   Всего отзывов: {stats['total_reviews']}")
-        print(f"   Средний % позитивных: {stats['avg_positive']}%")
-        print(f"   Позитивных отзывов: {stats['total_positive']}")
-        print(f"   Негативных отзывов: {stats['total_negative']}")
-        
         return all_data, stats, None
         
     except Exception as e:
@@ -455,32 +601,243 @@ def get_hive_data():
 def get_json_files_count():
     """Считаем количество JSON файлов"""
     try:
-        output_dir = "/app/output"
-        if os.path.exists(output_dir):
-            json_files = [f for f in os.listdir(output_dir) if f.endswith('.json')]
-            return len(json_files)
+        return summary_cache.get()[2]
     except:
         pass
     return 0
 
+# Колонки сводки, по которым можно сортировать и которые можно запрашивать в fields
+SUMMARY_COLUMNS = (
+    'restaurant_name', 'total_reviews', 'positive_reviews', 'negative_reviews', 'neutral_reviews',
+    'positive_percentage', 'negative_percentage', 'parsed_date', 'source_url'
+)
+REVIEW_COLUMNS = ('name', 'date', 'stars', 'text', 'sentiment', 'score', 'positive_words', 'negative_words')
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class ApiError(Exception):
+    pass
+
+
+def encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key), ensure_ascii=False).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        return tuple(json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')))
+    except Exception:
+        raise ApiError("Некорректный cursor")
+
+
+def _sort_value(value):
+    """Значение для сортировки: числа отдельно от строк, None в начале"""
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, float(value))
+    return (2, str(value))
+
+
+class SortedView:
+    """Отсортированные строки и ключи (значение, id) для бинарного поиска курсора"""
+
+    def __init__(self, items: list, column: str):
+        keyed = sorted(((_sort_value(item.get(column)), item['id']), item) for item in items)
+        self.keys = [key for key, _ in keyed]
+        self.items = [item for _, item in keyed]
+
+    def page(self, cursor: str, limit: int, descending: bool) -> tuple:
+        """(строки страницы, курсор следующей страницы или None)"""
+        if descending:
+            end = bisect.bisect_left(self.keys, self._cursor_key(cursor)) if cursor else len(self.keys)
+            start = max(0, end - limit)
+            items = self.items[start:end][::-1]
+            has_more = start > 0
+            last_key = self.keys[start] if items else None
+        else:
+            start = bisect.bisect_right(self.keys, self._cursor_key(cursor)) if cursor else 0
+            end = min(len(self.keys), start + limit)
+            items = self.items[start:end]
+            has_more = end < len(self.keys)
+            last_key = self.keys[end - 1] if items else None
+        return items, encode_cursor(last_key) if has_more else None
+
+    @staticmethod
+    def _cursor_key(cursor: str) -> tuple:
+        key = decode_cursor(cursor)
+        if len(key) != 2 or not isinstance(key[0], list):
+            raise ApiError("Некорректный cursor")
+        return (tuple(key[0]), key[1])
+
+
+def page_params(columns: tuple, default_sort: str, default_order: str) -> dict:
+    """Разбирает limit, cursor, sort, order и fields из строки запроса"""
+    try:
+        limit = int(request.args.get('limit', PAGE_SIZE))
+    except ValueError:
+        raise ApiError("limit должен быть числом")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    sort = request.args.get('sort', default_sort)
+    if sort not in columns:
+        raise ApiError(f"Сортировка возможна по: {', '.join(columns)}")
+    order = request.args.get('order', default_order)
+    if order not in ('asc', 'desc'):
+        raise ApiError("order должен быть asc или desc")
+
+    fields = None
+    if request.args.get('fields'):
+        fields = [field.strip() for field in request.args['fields'].split(',') if field.strip()]
+        unknown = [field for field in fields if field not in columns]
+        if unknown:
+            raise ApiError(f"Неизвестные поля: {', '.join(unknown)}")
+
+    return {'limit': limit, 'cursor': request.args.get('cursor'), 'sort': sort, 'order': order, 'fields': fields}
+
+
+def select_fields(items: list, fields: list) -> list:
+    if not fields:
+        return items
+    return [{'id': item['id'], **{field: item.get(field) for field in fields}} for item in items]
+
+
+def api_response(payload: dict, status: int = 200) -> Response:
+    """JSON-ответ, сжатый gzip если клиент это поддерживает"""
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    headers = {'Vary': 'Accept-Encoding'}
+    if len(body) > 1024 and 'gzip' in request.headers.get('Accept-Encoding', ''):
+        body = gzip.compress(body, compresslevel=5)
+        headers['Content-Encoding'] = 'gzip'
+    return Response(body, status=status, mimetype='application/json', headers=headers)
+
+
+# Отсортированные представления сводки: пересчитываются при изменении файлов
+summary_views = {}
+summary_views_lock = threading.Lock()
+
+
+def restaurants_page(sort: str = 'positive_percentage', order: str = 'desc', limit: int = PAGE_SIZE,
+                     cursor: str = None) -> tuple:
+    rows, _, _ = summary_cache.get()
+    key = (summary_cache.version, sort)
+    with summary_views_lock:
+        view = summary_views.get(sort)
+        if view is None or view[0] != key:
+            view = (key, SortedView(rows, sort))
+            summary_views[sort] = view
+    return view[1].page(cursor, limit, order == 'desc')
+
+
+class ReviewCache:
+    """Отзывы нескольких последних открытых файлов (LRU), ключ - (mtime, size) файла"""
+
+    def __init__(self, max_files: int = 8):
+        self.max_files = max_files
+        self.lock = threading.Lock()
+        self.files = OrderedDict()
+
+    def get(self, restaurant_id: str) -> list:
+        path = os.path.join(summary_cache.output_dir, restaurant_id + '.json')
+        stat = os.stat(path)
+        file_key = (stat.st_mtime, stat.st_size)
+        with self.lock:
+            cached = self.files.get(restaurant_id)
+            if cached and cached['key'] == file_key:
+                self.files.move_to_end(restaurant_id)
+                return cached
+
+        reviews = []
+        for index, (review_id, comment) in enumerate(iter_reviews(path)):
+            analysis = comment.get('analysis', {})
+            reviews.append({
+                'id': index,
+                'review_id': review_id,
+                'name': comment.get('name', ''),
+                'date': comment.get('date', ''),
+                'stars': comment.get('stars', 0),
+                'text': comment.get('text', ''),
+                'sentiment': comment.get('sentiment', 'neutral'),
+                'score': analysis.get('score', 0),
+                'positive_words': analysis.get('positive_words', []),
+                'negative_words': analysis.get('negative_words', [])
+            })
+
+        cached = {'key': file_key, 'reviews': reviews, 'views': {}}
+        with self.lock:
+            self.files[restaurant_id] = cached
+            self.files.move_to_end(restaurant_id)
+            while len(self.files) > self.max_files:
+                self.files.popitem(last=False)
+        return cached
+
+
+review_cache = ReviewCache()
+
+
+@app.route('/api/restaurants')
+def api_restaurants():
+    """Сводка по ресторанам постранично: ?limit=&cursor=&sort=&order=&fields="""
+    try:
+        params = page_params(SUMMARY_COLUMNS, 'positive_percentage', 'desc')
+        items, next_cursor = restaurants_page(params['sort'], params['order'], params['limit'], params['cursor'])
+    except ApiError as e:
+        return api_response({'error': str(e)}, 400)
+
+    return api_response({
+        'items': select_fields(items, params['fields']),
+        'next_cursor': next_cursor,
+        'total': len(summary_cache.sorted_rows),
+        'sort': params['sort'],
+        'order': params['order']
+    })
+
+
+@app.route('/api/restaurants/<restaurant_id>/reviews')
+def api_restaurant_reviews(restaurant_id):
+    """Отзывы одного файла результата постранично. id - из /api/restaurants"""
+    summary_cache.get()
+    if restaurant_id not in {name[:-len('.json')] for name in summary_cache.files}:
+        return api_response({'error': "Ресторан не найден"}, 404)
+
+    try:
+        params = page_params(REVIEW_COLUMNS + ('id',), 'id', 'asc')
+        cached = review_cache.get(restaurant_id)
+        view = cached['views'].get(params['sort'])
+        if view is None:
+            view = cached['views'][params['sort']] = SortedView(cached['reviews'], params['sort'])
+        items, next_cursor = view.page(params['cursor'], params['limit'], params['order'] == 'desc')
+    except ApiError as e:
+        return api_response({'error': str(e)}, 400)
+    except OSError:
+        return api_response({'error': "Ресторан не найден"}, 404)
+
+    return api_response({
+        'items': select_fields(items, params['fields']),
+        'next_cursor': next_cursor,
+        'total': len(cached['reviews']),
+        'sort': params['sort'],
+        'order': params['order']
+    })
+
+
 @app.route('/')
 def index():
     try:
-        # Ждем немного если Hive только запустился
-        time.sleep(3)
+        # Не ждем Hive: берем то, что уже готово по данным фоновой проверки
+        readiness.start()
+        status = readiness.status()
         
         # Получаем данные из Hive
         data, stats, error = get_hive_data()
+        next_cursor = None
+        if data:
+            # В HTML только первая страница рейтинга, остальное - через /api/restaurants
+            data, next_cursor = restaurants_page(limit=PAGE_SIZE)
         
-        # Создаем графики
-        histogram_img = None
-        pie_chart_img = None
-        try:
-            from visualization import create_histogram_from_hive, create_pie_chart
-            histogram_img = create_histogram_from_hive()
-            pie_chart_img = create_pie_chart()
-        except Exception as e:
-            print(f"⚠️ Ошибка при создании графиков: {e}")
+        # Графики отдаются отдельными запросами /charts/<name>.png
+        charts = ['histogram', 'pie'] if data else []
         
         # Если ошибка или нет данных, используем примерные данные для демонстрации
         if error or not data:
@@ -542,9 +899,6 @@ def index():
             if not error:
                 error = "Используются демо-данные. Запустите парсер для реальных данных."
         
-        # Преобразуем в JSON для отображения
-        json_data = json.dumps(data, ensure_ascii=False, indent=2)
-        
         # Количество JSON файлов
         json_files_count = get_json_files_count()
         
@@ -557,11 +911,13 @@ def index():
             data=data,
             stats=stats,
             error=error,
-            json_data=json_data,
-            histogram_img=histogram_img,
-            pie_chart_img=pie_chart_img,
+            next_cursor=next_cursor,
+            page_size=PAGE_SIZE,
+            charts=charts,
+            chart_version=summary_cache.version,
             json_files_count=json_files_count,
-            current_time=current_time
+            current_time=current_time,
+            readiness=status
         )
         
     except Exception as e:
@@ -576,10 +932,89 @@ def index():
         </div>
         '''
 
+# Данные для графиков из Hive перечитываются не чаще раза в CHART_DATA_TTL секунд
+# и сразу при изменении файлов в output/
+CHART_DATA_TTL = 30
+chart_data_cache = {}
+chart_data_lock = threading.Lock()
+
+
+def has_chart_data(data) -> bool:
+    """Есть что рисовать: SUM по пустой таблице Hive возвращает [None, None, None]"""
+    return bool(data) and any(data)
+
+
+def chart_data(name: str, hive_ready: bool):
+    """(данные графика, из Hive ли они) с учетом готовности Hive"""
+    key = (summary_cache.version, hive_ready)
+    with chart_data_lock:
+        cached = chart_data_cache.get(name)
+        if cached and cached['key'] == key and cached['expires'] > time.time():
+            return cached['data'], cached['from_hive']
+
+    from visualization import fetch_hive_histogram_rows, fetch_hive_pie_sizes
+    data, from_hive = None, False
+    if hive_ready:
+        try:
+            data = fetch_hive_histogram_rows() if name == 'histogram' else fetch_hive_pie_sizes()
+            from_hive = has_chart_data(data)
+        except Exception as e:
+            print(f"⚠️ Ошибка чтения данных графика из Hive: {e}")
+
+    if not from_hive:
+        # Hive недоступен или пуст - считаем по кэшу сводок из JSON
+        rows, stats, _ = summary_cache.get()
+        if name == 'histogram':
+            data = [(row['restaurant_name'], row['positive_percentage']) for row in rows]
+        elif stats:
+            data = [stats['total_positive'], stats['total_negative'], stats['total_neutral']]
+
+    with chart_data_lock:
+        chart_data_cache[name] = {'key': key, 'expires': time.time() + CHART_DATA_TTL,
+                                  'data': data, 'from_hive': from_hive}
+    return data, from_hive
+
+
+@app.route('/charts/<name>.png')
+def chart(name):
+    """PNG графика из кэша с ETag: перерисовка только при изменении данных"""
+    if name not in ('histogram', 'pie'):
+        return "Нет такого графика", 404
+
+    from visualization import cached_histogram, cached_pie
+    data, from_hive = chart_data(name, readiness.status()['hive'])
+    if not has_chart_data(data):
+        return "Нет данных для графика", 404
+
+    entry = cached_histogram(data, from_hive) if name == 'histogram' else cached_pie(data)
+    if entry is None:
+        return "Нет данных для графика", 404
+
+    headers = {'ETag': f'"{entry["etag"]}"', 'Cache-Control': 'public, max-age=60'}
+    if request.headers.get('If-None-Match') == headers['ETag']:
+        return Response(status=304, headers=headers)
+    return Response(entry['png'], mimetype='image/png', headers=headers)
+
+
+@app.route('/health')
+def health():
+    """Состояние источников данных для docker healthcheck и отладки"""
+    readiness.start()
+    status = readiness.status()
+    if status['backend'] == 'hive':
+        try:
+            from hive_pool import get_pool
+            status['hive_pool'] = get_pool().stats()
+        except Exception:
+            pass
+    return jsonify(status), 200 if status['output'] else 503
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("🌐 ВЕБ-СЕРВЕР ЗАПУСКАЕТСЯ")
     print("=" * 60)
     print("📊 Доступно по адресу: http://localhost:5000")
-    print("⏳ Ожидание подключения к Hive...")
+    print("⏳ Подключение к Hive проверяется в фоне, статус: /health")
+    readiness.start()
     app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False)
\ No newline at end of file